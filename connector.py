@@ -7,10 +7,12 @@ This connector provides tools for time tracking, project management, and detaile
 """
 
 import asyncio
+import functools
 import os
 import sys
 import logging
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -19,7 +21,7 @@ from mcp.server import Server
 from mcp.types import TextContent, Tool
 import mcp.server.stdio
 
-from toggl_server.main import AdminTogglServer, _calculate_date_range
+from toggl_server.main import AdminTogglServer, _calculate_date_range, _raise_first_error
 from toggl_server.main import (
     _get_organization_dashboard,
     _get_project_profitability_analysis,
@@ -39,292 +41,308 @@ server = Server("toggl-connector")
 # Initialize the admin server instance
 admin_server = AdminTogglServer()
 
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[Tool] = [
+    # Basic time tracking tools
+    Tool(
+        name="start_tracking",
+        description="Start tracking time for a new task",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Title/description of the task"},
+                "workspace_id": {"type": "integer", "description": "Workspace ID (optional)"},
+                "project_id": {"type": "integer", "description": "Project ID (optional)"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "List of tags (optional)"}
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="stop_tracking",
+        description="Stop the currently running time entry",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="show_current_time_entry",
+        description="Show the currently running time entry",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="list_workspaces",
+        description="List all available workspaces",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    
+    # Admin-level analytics tools
+    Tool(
+        name="get_organization_dashboard",
+        description="Get comprehensive organization dashboard with KPIs, hours, revenue, and profit metrics",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "period": {"type": "string", "enum": ["week", "month", "quarter", "year"], "description": "Predefined period (optional)"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_project_profitability_analysis",
+        description="Get detailed project profitability analysis with profit margins, utilization rates, and ROI",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "sort_by": {"type": "string", "enum": ["profit", "revenue", "margin", "hours"], "description": "Sort criterion"},
+                "min_hours": {"type": "number", "description": "Minimum hours threshold for inclusion"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_team_productivity_report",
+        description="Get team productivity report with utilization rates, performance metrics, and capacity analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "include_individual_metrics": {"type": "boolean", "description": "Include individual employee metrics"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_client_profitability_analysis",
+        description="Get client-level profitability and revenue analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "min_revenue": {"type": "number", "description": "Minimum revenue threshold"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_financial_summary",
+        description="Get high-level financial summary with revenue, costs, and profit trends",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "period": {"type": "string", "enum": ["month", "quarter", "year"], "description": "Period for analysis"},
+                "compare_previous": {"type": "boolean", "description": "Include comparison with previous period"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_productivity_insights",
+        description="Get advanced productivity insights and time tracking patterns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "include_detailed_analysis": {"type": "boolean", "description": "Include detailed time entry analysis"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_employee_project_breakdown",
+        description="Get detailed project breakdown for a specific employee showing all projects they worked on",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "employee_name": {"type": "string", "description": "Name of the employee to analyze"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "include_time_entries": {"type": "boolean", "description": "Include detailed time entries breakdown"}
+            },
+            "required": ["workspace_id", "employee_name"]
+        }
+    )
+]
+
+# _TOOLS is already built once, so this stays a plain coroutine - functools.cache
+# would memoize the coroutine object, which can only be awaited once
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """List all available tools for the Toggl connector"""
-    return [
-        # Basic time tracking tools
-        Tool(
-            name="start_tracking",
-            description="Start tracking time for a new task",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Title/description of the task"},
-                    "workspace_id": {"type": "integer", "description": "Workspace ID (optional)"},
-                    "project_id": {"type": "integer", "description": "Project ID (optional)"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "List of tags (optional)"}
-                },
-                "required": ["title"]
-            }
-        ),
-        Tool(
-            name="stop_tracking",
-            description="Stop the currently running time entry",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="show_current_time_entry",
-            description="Show the currently running time entry",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="list_workspaces",
-            description="List all available workspaces",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        
-        # Admin-level analytics tools
-        Tool(
-            name="get_organization_dashboard",
-            description="Get comprehensive organization dashboard with KPIs, hours, revenue, and profit metrics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "period": {"type": "string", "enum": ["week", "month", "quarter", "year"], "description": "Predefined period (optional)"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_project_profitability_analysis",
-            description="Get detailed project profitability analysis with profit margins, utilization rates, and ROI",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "sort_by": {"type": "string", "enum": ["profit", "revenue", "margin", "hours"], "description": "Sort criterion"},
-                    "min_hours": {"type": "number", "description": "Minimum hours threshold for inclusion"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_team_productivity_report",
-            description="Get team productivity report with utilization rates, performance metrics, and capacity analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "include_individual_metrics": {"type": "boolean", "description": "Include individual employee metrics"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_client_profitability_analysis",
-            description="Get client-level profitability and revenue analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "min_revenue": {"type": "number", "description": "Minimum revenue threshold"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_financial_summary",
-            description="Get high-level financial summary with revenue, costs, and profit trends",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "period": {"type": "string", "enum": ["month", "quarter", "year"], "description": "Period for analysis"},
-                    "compare_previous": {"type": "boolean", "description": "Include comparison with previous period"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_productivity_insights",
-            description="Get advanced productivity insights and time tracking patterns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "include_detailed_analysis": {"type": "boolean", "description": "Include detailed time entry analysis"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_employee_project_breakdown",
-            description="Get detailed project breakdown for a specific employee showing all projects they worked on",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "employee_name": {"type": "string", "description": "Name of the employee to analyze"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "include_time_entries": {"type": "boolean", "description": "Include detailed time entries breakdown"}
-                },
-                "required": ["workspace_id", "employee_name"]
-            }
-        )
-    ]
+    return _TOOLS
+
+# Tool handlers take the call arguments and return the response text (or a prebuilt response)
+ToolHandler = Callable[[dict[str, Any]], Awaitable[str | list[TextContent]]]
+
+# Fixed responses, built once - MCP serializes and discards them, so sharing is safe
+_TRACK_API_ERROR = [TextContent(type="text", text="Error: Toggl API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
+_REPORTS_API_ERROR = [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
+
+def require_track_api(handler: ToolHandler) -> ToolHandler:
+    """Return the uninitialized-API error instead of calling the handler when the Track API is missing"""
+    @functools.wraps(handler)
+    async def wrapper(arguments: dict[str, Any]) -> str | list[TextContent]:
+        if not admin_server.toggl_api:
+            return _TRACK_API_ERROR
+        return await handler(arguments)
+    return wrapper
+
+def require_reports_api(handler: ToolHandler) -> ToolHandler:
+    """Return the uninitialized-API error instead of calling the handler when the Reports API is missing"""
+    @functools.wraps(handler)
+    async def wrapper(arguments: dict[str, Any]) -> str | list[TextContent]:
+        if not admin_server.reports_api:
+            return _REPORTS_API_ERROR
+        return await handler(arguments)
+    return wrapper
+
+# Basic time tracking tools
+@require_track_api
+async def _start_tracking(arguments: dict[str, Any]) -> str:
+    workspace_id = arguments.get("workspace_id") or await admin_server.get_default_workspace_id()
+    result = await admin_server.toggl_api.start_time_entry(
+        arguments["title"],
+        workspace_id,
+        arguments.get("project_id"),
+        arguments.get("tags", [])
+    )
+    return f"Started tracking: {result}"
+
+@require_track_api
+async def _stop_tracking(arguments: dict[str, Any]) -> str:
+    result = await admin_server.toggl_api.stop_current_time_entry()
+    return f"Stopped tracking: {result}"
+
+@require_track_api
+async def _show_current_time_entry(arguments: dict[str, Any]) -> str:
+    result = await admin_server.toggl_api.get_current_time_entry()
+    return f"Current entry: {result}"
+
+@require_track_api
+async def _list_workspaces(arguments: dict[str, Any]) -> list[TextContent]:
+    return await admin_server.get_workspace_listing()
+
+# Admin analytics tools
+@require_reports_api
+async def _organization_dashboard(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        arguments.get("period"),
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    # Use the local admin_server instance instead of the global one
+    return await _get_organization_dashboard_local(admin_server, arguments["workspace_id"], start_date, end_date)
+
+@require_reports_api
+async def _project_profitability_analysis(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    # Use the processor-based approach directly
+    return await _get_project_profitability_analysis_with_processor(
+        admin_server, arguments["workspace_id"], start_date, end_date,
+        arguments.get("sort_by", "profit"),
+        arguments.get("min_hours", 0)
+    )
+
+@require_reports_api
+async def _team_productivity_report(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_team_productivity_report_local(
+        admin_server, arguments["workspace_id"], start_date, end_date,
+        arguments.get("include_individual_metrics", True)
+    )
+
+@require_reports_api
+async def _client_profitability_analysis(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_client_profitability_analysis_local(
+        admin_server, arguments["workspace_id"], start_date, end_date,
+        arguments.get("min_revenue", 0)
+    )
+
+@require_reports_api
+async def _financial_summary(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(arguments.get("period", "month"))
+    return await _get_financial_summary_local(
+        admin_server, arguments["workspace_id"], start_date, end_date,
+        arguments.get("compare_previous", False)
+    )
+
+@require_reports_api
+async def _productivity_insights(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_productivity_insights_local(
+        admin_server, arguments["workspace_id"], start_date, end_date,
+        arguments.get("include_detailed_analysis", False)
+    )
+
+@require_reports_api
+async def _employee_project_breakdown(arguments: dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_employee_project_breakdown_local(
+        admin_server, arguments["workspace_id"], arguments["employee_name"], start_date, end_date,
+        arguments.get("include_time_entries", False)
+    )
+
+# Tool name -> handler, built once at import time so dispatch is a single lookup
+_HANDLERS: dict[str, ToolHandler] = {
+    "start_tracking": _start_tracking,
+    "stop_tracking": _stop_tracking,
+    "show_current_time_entry": _show_current_time_entry,
+    "list_workspaces": _list_workspaces,
+    "get_organization_dashboard": _organization_dashboard,
+    "get_project_profitability_analysis": _project_profitability_analysis,
+    "get_team_productivity_report": _team_productivity_report,
+    "get_client_profitability_analysis": _client_profitability_analysis,
+    "get_financial_summary": _financial_summary,
+    "get_productivity_insights": _productivity_insights,
+    "get_employee_project_breakdown": _employee_project_breakdown,
+}
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, any]) -> list[TextContent]:
     """Handle tool calls for the Toggl connector"""
     
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
     try:
-        # Basic time tracking tools
-        if name == "start_tracking":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            result = await admin_server.toggl_api.start_time_entry(
-                arguments["title"],
-                arguments.get("workspace_id"),
-                arguments.get("project_id"),
-                arguments.get("tags", [])
-            )
-            return [TextContent(type="text", text=f"Started tracking: {result}")]
-        
-        elif name == "stop_tracking":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            result = await admin_server.toggl_api.stop_current_time_entry()
-            return [TextContent(type="text", text=f"Stopped tracking: {result}")]
-        
-        elif name == "show_current_time_entry":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            result = await admin_server.toggl_api.get_current_time_entry()
-            return [TextContent(type="text", text=f"Current entry: {result}")]
-        
-        elif name == "list_workspaces":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspaces = await admin_server.toggl_api.get_workspaces()
-            workspace_list = "\n".join([f"• {ws.name} (ID: {ws.id})" for ws in workspaces])
-            return [TextContent(type="text", text=f"Available workspaces:\n{workspace_list}")]
-        
-        # Admin analytics tools
-        elif name == "get_organization_dashboard":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                arguments.get("period"),
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            # Use the local admin_server instance instead of the global one
-            result = await _get_organization_dashboard_local(admin_server, workspace_id, start_date, end_date)
+        result = await handler(arguments)
+        if isinstance(result, str):
             return [TextContent(type="text", text=result)]
-        
-        elif name == "get_project_profitability_analysis":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            # Use the processor-based approach directly
-            result = await _get_project_profitability_analysis_with_processor(
-                admin_server, workspace_id, start_date, end_date,
-                arguments.get("sort_by", "profit"),
-                arguments.get("min_hours", 0)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_team_productivity_report":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_team_productivity_report_local(
-                admin_server, workspace_id, start_date, end_date,
-                arguments.get("include_individual_metrics", True)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_client_profitability_analysis":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_client_profitability_analysis_local(
-                admin_server, workspace_id, start_date, end_date,
-                arguments.get("min_revenue", 0)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_financial_summary":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            period = arguments.get("period", "month")
-            start_date, end_date = _calculate_date_range(period)
-            
-            result = await _get_financial_summary_local(
-                admin_server, workspace_id, start_date, end_date,
-                arguments.get("compare_previous", False)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_productivity_insights":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_productivity_insights_local(
-                admin_server, workspace_id, start_date, end_date,
-                arguments.get("include_detailed_analysis", False)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_employee_project_breakdown":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your TOGGL_API_TOKEN environment variable.")]
-            workspace_id = arguments["workspace_id"]
-            employee_name = arguments["employee_name"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_employee_project_breakdown_local(
-                admin_server, workspace_id, employee_name, start_date, end_date,
-                arguments.get("include_time_entries", False)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return result
     
     except Exception as e:
         logger.error(f"Error in tool {name}: {e}")
@@ -353,40 +371,22 @@ async def main():
 async def _get_organization_dashboard_local(admin_server_instance, workspace_id: int, start_date: str, end_date: str) -> str:
     """Get comprehensive organization dashboard using local admin_server instance with real labor costs"""
     try:
-        # Get workspace info
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            workspace_dict = {
-                'id': workspace_info.id,
-                'name': workspace_info.name,
-                'default_currency': workspace_info.default_currency
-            }
-        else:
-            workspace_dict = workspace_info
-        
-        # Use the new processor with real labor costs for accurate calculations
-        print("🚀 ORGANIZATION DASHBOARD - Using processor with real labor costs! 🚀")
-        
-        # Get insights data for profitability analysis
-        insights_data = await admin_server_instance.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "projects"
+        # Workspace info and insights data are independent, so fetch them concurrently
+        results = await asyncio.gather(
+            admin_server_instance.get_workspace_info(workspace_id),
+            admin_server_instance.reports_api.get_insights_profitability(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            return_exceptions=True
         )
+        _raise_first_error(results)
+        workspace_info, insights_data = results
         
         if not insights_data:
             raise Exception("Failed to get insights data")
         
-        print("✅ Got insights data successfully")
-        
-        # Determine currency
-        currency = workspace_dict.get('default_currency', 'USD')
-        if isinstance(workspace_info, dict):
-            currency = workspace_info.get('default_currency', 'USD')
-        elif hasattr(workspace_info, 'default_currency'):
-            currency = workspace_info.default_currency or 'USD'
-        else:
-            currency = 'USD'
+        # get_workspace_info always returns a dict
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Use the processor to get accurate project data with real labor costs
         projects = await admin_server_instance.processor.process_project_profitability(
@@ -409,15 +409,15 @@ async def _get_organization_dashboard_local(admin_server_instance, workspace_id:
         # Check if we have data
         if total_revenue == 0:
             return f"""
-🏢 **ORGANIZATION DASHBOARD** - {workspace_dict.get('name', 'Unknown')}
+🏢 **ORGANIZATION DASHBOARD** - {workspace_info.get('name', 'Unknown')}
 📅 Period: {start_date} to {end_date}
 
 📊 **KEY METRICS**
 • Total Hours: 0.0h
-• Total Revenue: {workspace_dict.get('default_currency', 'USD')} 0.00
-• Total Labor Cost: {workspace_dict.get('default_currency', 'USD')} 0.00
-• Total Profit: {workspace_dict.get('default_currency', 'USD')} 0.00 (0.0% margin)
-• Average Rate: {workspace_dict.get('default_currency', 'USD')} 0.00/hour
+• Total Revenue: {currency} 0.00
+• Total Labor Cost: {currency} 0.00
+• Total Profit: {currency} 0.00 (0.0% margin)
+• Average Rate: {currency} 0.00/hour
 
 🎯 **ORGANIZATIONAL HEALTH**
 • Active Projects: 0
@@ -441,15 +441,15 @@ async def _get_organization_dashboard_local(admin_server_instance, workspace_id:
         
         # Format output using correct data
         return f"""
-🏢 **ORGANIZATION DASHBOARD** - {workspace_dict.get('name', 'Unknown')}
+🏢 **ORGANIZATION DASHBOARD** - {workspace_info.get('name', 'Unknown')}
 📅 Period: {start_date} to {end_date}
 
 📊 **KEY METRICS**
 • Total Hours: {total_hours:,.1f}h
-• Total Revenue: {workspace_dict.get('default_currency', 'USD')} {total_revenue:,.2f}
-• Total Labor Cost: {workspace_dict.get('default_currency', 'USD')} {total_labor_cost:,.2f}
-• Total Profit: {workspace_dict.get('default_currency', 'USD')} {total_profit:,.2f} ({profit_margin:.1f}% margin)
-• Average Rate: {workspace_dict.get('default_currency', 'USD')} {average_hourly_rate:,.2f}/hour
+• Total Revenue: {currency} {total_revenue:,.2f}
+• Total Labor Cost: {currency} {total_labor_cost:,.2f}
+• Total Profit: {currency} {total_profit:,.2f} ({profit_margin:.1f}% margin)
+• Average Rate: {currency} {average_hourly_rate:,.2f}/hour
 • Labor Cost %: 60% of billing rate
 
 🎯 **ORGANIZATIONAL HEALTH**
@@ -459,11 +459,11 @@ async def _get_organization_dashboard_local(admin_server_instance, workspace_id:
 • Time Entries: {total_time_entries:,}
 
 💼 **TOP PROJECTS** (by revenue)
-{chr(10).join([f"• {p.project_name}: {workspace_dict.get('default_currency', 'USD')} {float(p.revenue):,.2f}" for p in sorted(projects, key=lambda p: float(p.revenue), reverse=True)[:5]])}
+{chr(10).join([f"• {p.project_name}: {currency} {float(p.revenue):,.2f}" for p in sorted(projects, key=lambda p: float(p.revenue), reverse=True)[:5]])}
 
 📈 **SUMMARY**
 • Total Time Tracked: {total_hours:,.1f} hours
-• Revenue per Hour: {workspace_dict.get('default_currency', 'USD')} {average_hourly_rate:,.2f}
+• Revenue per Hour: {currency} {average_hourly_rate:,.2f}
 • Profit Margin: {profit_margin:.1f}%
         """.strip()
         
@@ -473,17 +473,18 @@ async def _get_organization_dashboard_local(admin_server_instance, workspace_id:
 async def _get_project_profitability_analysis_local(admin_server_instance, workspace_id: int, start_date: str, end_date: str, sort_by: str, min_hours: float) -> str:
     """Get detailed project profitability analysis using local admin_server instance"""
     try:
-        # Get detailed entries from Reports API v3 for accurate profitability calculations
-        detailed_entries = await admin_server_instance.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
+        # Get detailed entries from Reports API v3 for accurate profitability calculations,
+        # alongside the workspace info
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_detailed_report_v3(
+                workspace_id, start_date, end_date, hide_amounts=False
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        _raise_first_error(results)
+        detailed_entries, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         if not detailed_entries:
             return "No projects found matching the criteria."
@@ -588,25 +589,24 @@ async def _get_project_profitability_analysis_local(admin_server_instance, works
 async def _get_team_productivity_report_local(admin_server_instance, workspace_id: int, start_date: str, end_date: str, include_individual_metrics: bool) -> str:
     """Get team productivity report using local admin_server instance with real labor costs"""
     try:
-        # Use the new processor with real labor costs for accurate calculations
-        print("🚀 TEAM PRODUCTIVITY REPORT - Using processor with real labor costs! 🚀")
-        
-        # Get insights data for profitability analysis
-        insights_data = await admin_server_instance.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "projects"
+        # Project insights, workspace info and user insights (for team data) are independent
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_insights_profitability(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            admin_server_instance.reports_api.get_insights_profitability(
+                workspace_id, start_date, end_date, "users"
+            ),
+            return_exceptions=True
         )
+        _raise_first_error(results)
+        insights_data, workspace_info, user_insights = results
         
         if not insights_data:
             raise Exception("Failed to get insights data")
         
-        print("✅ Got insights data successfully")
-        
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Use the processor to get accurate project data with real labor costs
         projects = await admin_server_instance.processor.process_project_profitability(
@@ -616,11 +616,6 @@ async def _get_team_productivity_report_local(admin_server_instance, workspace_i
             admin_server_instance.reports_api
         )
         
-        # Get user insights for team data
-        user_insights = await admin_server_instance.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "users"
-        )
-        
         if not user_insights or not user_insights.get('data'):
             return "No team members found or data available for this period."
         
@@ -763,17 +758,18 @@ async def _get_team_productivity_report_local(admin_server_instance, workspace_i
 async def _get_client_profitability_analysis_local(admin_server_instance, workspace_id: int, start_date: str, end_date: str, min_revenue: float) -> str:
     """Get client-level profitability and revenue analysis using local admin_server instance"""
     try:
-        # Get detailed entries from Reports API v3 for accurate profitability calculations
-        detailed_entries = await admin_server_instance.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
+        # Get detailed entries from Reports API v3 for accurate profitability calculations,
+        # alongside the workspace info
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_detailed_report_v3(
+                workspace_id, start_date, end_date, hide_amounts=False
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        _raise_first_error(results)
+        detailed_entries, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         if not detailed_entries:
             return "No clients found matching the criteria."
@@ -862,22 +858,21 @@ async def _get_client_profitability_analysis_local(admin_server_instance, worksp
 async def _get_financial_summary_local(admin_server_instance, workspace_id: int, start_date: str, end_date: str, compare_previous: bool) -> str:
     """Get high-level financial summary using local admin_server instance"""
     try:
-        # Get Summary Report for accurate revenue data
-        summary_data = await admin_server_instance.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "projects"
-        )
-        
-        # Get detailed entries from Reports API v3 for labor cost calculations
-        detailed_entries = await admin_server_instance.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
+        # Summary Report for accurate revenue data, detailed entries from Reports API v3
+        # for labor cost calculations, and workspace info - all independent
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            admin_server_instance.reports_api.get_detailed_report_v3(
+                workspace_id, start_date, end_date, hide_amounts=False
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        _raise_first_error(results)
+        summary_data, detailed_entries, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Calculate revenue from Summary Report (accurate)
         total_revenue = 0
@@ -911,14 +906,14 @@ async def _get_financial_summary_local(admin_server_instance, workspace_id: int,
         profit_margin = (total_profit / total_revenue * 100) if total_revenue > 0 else 0
         average_hourly_rate = total_revenue / total_hours if total_hours > 0 else 0
         
-        result = f"""
+        parts = [f"""
 💰 **FINANCIAL SUMMARY**
 📅 Period: {start_date} to {end_date}
-🔍 Showing financial summary for {workspace_info.name if hasattr(workspace_info, 'name') else workspace_info.get('name', 'this workspace')}
+🔍 Showing financial summary for {workspace_info.get('name', 'this workspace')}
 
-"""
+"""]
         
-        result += f"""
+        parts.append(f"""
 📊 **FINANCIAL SUMMARY**
 • Total Hours: {total_hours:,.1f}h
 • Total Revenue: {currency} {total_revenue:,.2f}
@@ -926,16 +921,16 @@ async def _get_financial_summary_local(admin_server_instance, workspace_id: int,
 • Total Profit: {currency} {total_profit:,.2f}
 • Profit Margin: {profit_margin:.1f}%
 • Average Hourly Rate: {currency} {average_hourly_rate:,.2f}
-"""
+""")
         
         if compare_previous:
-            result += f"""
+            parts.append(f"""
 📈 **COMPARISON WITH PREVIOUS PERIOD**
 • This feature is currently being enhanced to provide period-over-period comparisons.
 • Current focus is on current period financial metrics.
-"""
+""")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Failed to get financial summary: {str(e)}"
@@ -943,22 +938,21 @@ async def _get_financial_summary_local(admin_server_instance, workspace_id: int,
 async def _get_productivity_insights_local(admin_server_instance, workspace_id: int, start_date: str, end_date: str, include_detailed_analysis: bool) -> str:
     """Get advanced productivity insights and time tracking patterns using local admin_server instance"""
     try:
-        # Get Summary Report for accurate revenue data
-        summary_data = await admin_server_instance.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "projects"
-        )
-        
-        # Get detailed entries from Reports API v3 for labor cost calculations
-        detailed_entries = await admin_server_instance.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
+        # Summary Report for accurate revenue data, detailed entries from Reports API v3
+        # for labor cost calculations, and workspace info - all independent
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            admin_server_instance.reports_api.get_detailed_report_v3(
+                workspace_id, start_date, end_date, hide_amounts=False
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        _raise_first_error(results)
+        summary_data, detailed_entries, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Calculate revenue from Summary Report (accurate)
         total_revenue = 0
@@ -992,14 +986,14 @@ async def _get_productivity_insights_local(admin_server_instance, workspace_id:
         profit_margin = (total_profit / total_revenue * 100) if total_revenue > 0 else 0
         average_hourly_rate = total_revenue / total_hours if total_hours > 0 else 0
         
-        result = f"""
+        parts = [f"""
 💡 **PRODUCTIVITY INSIGHTS**
 📅 Period: {start_date} to {end_date}
-🔍 Showing productivity insights for {workspace_info.name if hasattr(workspace_info, 'name') else workspace_info.get('name', 'this workspace')}
+🔍 Showing productivity insights for {workspace_info.get('name', 'this workspace')}
 
-"""
+"""]
         
-        result += f"""
+        parts.append(f"""
 📊 **TIME TRACKING PATTERNS**
 • Total Hours: {total_hours:,.1f}h
 • Average Hourly Rate: {currency} {average_hourly_rate:.2f}
@@ -1010,16 +1004,16 @@ async def _get_productivity_insights_local(admin_server_instance, workspace_id:
 • Total Profit: {currency} {total_profit:,.2f}
 • Profit Margin: {profit_margin:.1f}%
 • Labor Cost %: 60% of billing rate
-"""
+""")
         
         if include_detailed_analysis:
-            result += f"""
+            parts.append(f"""
 📊 **DETAILED ANALYSIS**
 • This feature is currently being enhanced to provide more detailed insights.
 • Current focus is on high-level productivity metrics and utilization rates.
-"""
+""")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Failed to get productivity insights: {str(e)}"
@@ -1027,27 +1021,24 @@ async def _get_productivity_insights_local(admin_server_instance, workspace_id:
 async def _get_employee_project_breakdown_local(admin_server_instance, workspace_id: int, employee_name: str, start_date: str, end_date: str, include_time_entries: bool) -> str:
     """Get detailed project breakdown for a specific employee using local admin_server instance"""
     try:
-        # Get Summary Report for users to get complete employee data
-        user_summary = await admin_server_instance.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "users"
-        )
-        
-        # Get Summary Report for projects to get project names
-        project_summary = await admin_server_instance.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "projects"
+        # User summary (employee data), project summary (project names), detailed entries
+        # (project mapping) and workspace info are independent, so fetch them concurrently
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "users"
+            ),
+            admin_server_instance.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            admin_server_instance.reports_api.get_detailed_report_v3(
+                workspace_id, start_date, end_date, hide_amounts=False
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        # Get detailed entries from Reports API v3 for project mapping
-        detailed_entries = await admin_server_instance.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
-        )
-        
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Convert workspace info to dict if it's a dataclass
-        if hasattr(workspace_info, 'name'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        _raise_first_error(results)
+        user_summary, project_summary, detailed_entries, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Find the employee data
         employee_data = None
@@ -1154,21 +1145,22 @@ async def _get_employee_project_breakdown_local(admin_server_instance, workspace
 📋 **PROJECTS WORKED ON**
 """
         
-        for i, project in enumerate(project_list, 1):
-            result += f"• {project}\n"
+        result += "".join([f"• {project}\n" for project in project_list])
         
         if include_time_entries:
             result += f"""
 📝 **RECENT TIME ENTRIES**
 """
             # Show last 10 time entries
-            for i, item in enumerate(employee_data.get('items', [])[:10], 1):
+            entry_lines = []
+            for item in employee_data.get('items', [])[:10]:
                 time_entry_title = item.get('title', {}).get('time_entry', 'Unknown')
                 entry_time = item.get('time', 0)
                 entry_hours = entry_time / (1000 * 60 * 60)  # Convert ms to hours
                 entry_revenue = sum(currency_info.get('amount', 0) for currency_info in item.get('currencies', []))
                 
-                result += f"• {time_entry_title} ({entry_hours:.1f}h, {currency} {entry_revenue:.2f})\n"
+                entry_lines.append(f"• {time_entry_title} ({entry_hours:.1f}h, {currency} {entry_revenue:.2f})\n")
+            result += "".join(entry_lines)
         
         return result
         
@@ -1178,24 +1170,17 @@ async def _get_employee_project_breakdown_local(admin_server_instance, workspace
 async def _get_project_profitability_analysis_with_processor(admin_server_instance, workspace_id: int, start_date: str, end_date: str, sort_by: str, min_hours: float) -> str:
     """Get detailed project profitability analysis using the processor for accurate project names"""
     try:
-        print("🚀 PROCESSOR-BASED ANALYSIS STARTING! 🚀", flush=True)
-        
-        # Get insights data using the processor approach
-        insights_data = await admin_server_instance.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "projects"
+        # Insights data for the processor and workspace info for currency, fetched concurrently
+        results = await asyncio.gather(
+            admin_server_instance.reports_api.get_insights_profitability(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            admin_server_instance.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        print(f"✅ Got insights data successfully", flush=True)
-        
-        # Get workspace info for currency
-        workspace_info = await admin_server_instance.get_workspace_info(workspace_id)
-        # Handle both dict and object cases
-        if hasattr(workspace_info, 'default_currency'):
-            currency = workspace_info.default_currency
-        elif isinstance(workspace_info, dict):
-            currency = workspace_info.get('default_currency', 'USD')
-        else:
-            currency = 'USD'
+        _raise_first_error(results)
+        insights_data, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Use the processor to get proper project data with actual employee rates
         projects = await admin_server_instance.processor.process_project_profitability(
@@ -1205,7 +1190,7 @@ async def _get_project_profitability_analysis_with_processor(admin_server_instan
             admin_server_instance.reports_api
         )
         
-        print(f"Received {len(projects)} valid ProjectProfitability objects from processor")
+        logger.debug("Received %d valid ProjectProfitability objects from processor", len(projects))
         
         # Filter by minimum hours
         if min_hours > 0:
@@ -1222,11 +1207,11 @@ async def _get_project_profitability_analysis_with_processor(admin_server_instan
                     if hours >= min_hours:
                         filtered_projects.append(p)
                 except Exception as e:
-                    print(f"Error filtering project: {str(e)}", flush=True)
+                    logger.error("Error filtering project: %s", e)
                     continue
                     
             projects = filtered_projects
-            print(f"After min_hours filter ({min_hours}h): {len(projects)} projects")
+            logger.debug("After min_hours filter (%sh): %d projects", min_hours, len(projects))
         
         # Sort by specified criterion
         def safe_sort_key(p, attr_name, default=0):
@@ -1250,7 +1235,7 @@ async def _get_project_profitability_analysis_with_processor(admin_server_instan
                 projects.sort(key=lambda p: safe_sort_key(p, 'total_hours'), reverse=True)
             # Default is already sorted by profit
         except Exception as e:
-            print(f"Error sorting projects by {sort_by}: {str(e)}", flush=True)
+            logger.error("Error sorting projects by %s: %s", sort_by, e)
         
         if not projects:
             return "No projects found matching the criteria."
@@ -22,7 +22,8 @@ def check_python_version():
 def check_dependencies():
     """Check if required dependencies are installed"""
     required_packages = [
-        "httpx",
+        "aiohttp",
+        "certifi",
         "mcp",
         "pydantic",
         "python-dateutil"
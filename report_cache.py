@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of rendered reports for the manual test scripts
+
+Closed historical date ranges always render the same report, so repeated test runs
+can reuse earlier output instead of hitting the Toggl APIs (and their rate limits)
+again. Caching is opt-in: set TOGGL_TEST_USE_CACHE=1 to enable it, and leave it unset
+for a fresh validation run against the live APIs.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / ".test_cache"
+CACHE_TTL = 7 * 24 * 3600  # One week
+
+def _cache_key(report_fn, args, kwargs) -> str:
+    """Hash the report function name and its arguments; non-JSON values (the server) are keyed by type"""
+    payload = json.dumps(
+        {"fn": report_fn.__name__, "args": args, "kwargs": kwargs},
+        sort_keys=True,
+        default=lambda value: type(value).__name__
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+async def cached_report(report_fn, *args, **kwargs) -> str:
+    """
+    Await report_fn(*args, **kwargs), reusing its output from disk when caching is enabled
+    
+    Args:
+        report_fn: Async report function, e.g. connector._get_organization_dashboard_local
+        *args: Positional arguments for report_fn
+        **kwargs: Keyword arguments for report_fn
+    
+    Returns:
+        The rendered report
+    """
+    if os.getenv("TOGGL_TEST_USE_CACHE") != "1":
+        return await report_fn(*args, **kwargs)
+    
+    path = CACHE_DIR / f"{_cache_key(report_fn, args, kwargs)}.json"
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL:
+            return json.loads(path.read_text())
+    except FileNotFoundError:
+        pass
+    
+    report = await report_fn(*args, **kwargs)
+    # Report functions render failures as text; never keep those around
+    if isinstance(report, str) and not report.startswith("Failed to get"):
+        CACHE_DIR.mkdir(exist_ok=True)
+        path.write_text(json.dumps(report))
+    return report
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Run the async test scripts back to back on one event loop
+
+Each script calls asyncio.run() on its own, which builds and tears down an event loop
+and, with it, the shared HTTP session and warmed API clients. Running them through a
+single asyncio.Runner lets initialize_apis reuse the same clients, connection pool and
+caches across every script, then closes them once at the end.
+"""
+import asyncio
+import sys
+
+from script_output import buffered_stdout
+from test_connector import test_connector
+from test_revenue_fix import test_revenue_fix
+from test_final_integration import test_final_integration
+from test_all_reports_consistency import test_all_reports_consistency
+
+from toggl_server.main import close_apis
+
+TESTS = [
+    test_connector,
+    test_revenue_fix,
+    test_final_integration,
+    test_all_reports_consistency,
+]
+
+def main() -> int:
+    """Run every test script on a shared event loop; non-zero if the connector check fails"""
+    with asyncio.Runner() as runner:
+        try:
+            # test_connector is the only script that reports success; the others print their results
+            results = [runner.run(test()) for test in TESTS]
+        finally:
+            runner.run(close_apis())
+    return 1 if results[0] is False else 0
+
+if __name__ == "__main__":
+    with buffered_stdout():
+        exit_code = main()
+    sys.exit(exit_code)
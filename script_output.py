@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Buffered stdout for the manual test scripts
+
+The test scripts print a line per metric and check. When stdout is piped (CI, log
+capture) each print is its own write syscall, so collect the output in memory and
+write it once at the end. Interactive terminals keep printing line by line.
+"""
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+@contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it out in one go when stdout is not a terminal"""
+    if sys.stdout.isatty():
+        yield
+        return
+    
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        # Flush even when the script fails so its progress output is not lost
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
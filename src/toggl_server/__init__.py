@@ -3,8 +3,8 @@ Lazy Toggl MCP Server package.
 """
 
 from .main import AdminTogglServer, main
-from .toggl_api import TogglAPI, TogglAPIError
+from .toggl_api import TogglAPI, TogglAPIError, TogglAuthError
 from .models import TogglTimeEntry, TogglWorkspace
 
 __version__ = "0.1.0"
-__all__ = ["AdminTogglServer", "main", "TogglAPI", "TogglAPIError", "TogglTimeEntry", "TogglWorkspace"]
+__all__ = ["AdminTogglServer", "main", "TogglAPI", "TogglAPIError", "TogglAuthError", "TogglTimeEntry", "TogglWorkspace"]
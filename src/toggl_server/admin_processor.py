@@ -1,20 +1,33 @@
 """
 Data processing functions for admin-level analytics and reporting
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime, timedelta
+import heapq
 import logging
 from collections import defaultdict, Counter
+from operator import attrgetter, itemgetter
 
 from .models import (
     OrganizationSummary, ProjectProfitability, EmployeeProfitability,
     ClientProfitability, TeamProductivityMetrics, AdminReportData,
-    TimeTrackingInsights, BillingAnalysis
+    TimeTrackingInsights, BillingAnalysis, ProductivitySummary, FinancialSummary
 )
 
 logger = logging.getLogger(__name__)
 
+_get_currency = itemgetter('currency')
+_get_amount = itemgetter('amount')
+_get_profit = attrgetter('profit')
+_get_utilization_rate = attrgetter('utilization_rate')
+
+_CENTS = Decimal('100')
+_SECONDS_PER_HOUR = Decimal('3600')
+
+# Labor cost as a share of the billing rate, used by the Reports API v3 calculations
+LABOR_COST_PERCENTAGE = 0.6
+
 class AdminDataProcessor:
     """Processes raw Toggl API data into admin-level insights"""
     
@@ -24,6 +37,7 @@ class AdminDataProcessor:
         self._estimated_employee_rates = {}
         self._user_rates_cache = {}  # Cache for user rates to avoid repeated API calls
         self._project_user_rates_cache = {}  # Cache for project-specific user rates
+        self.labor_cost_percentage = LABOR_COST_PERCENTAGE  # Read by the v3 labor cost calculations
     
     def _safe_decimal(self, value: Any) -> Decimal:
         """Safely convert value to Decimal"""
@@ -40,6 +54,11 @@ class AdminDataProcessor:
             return 0.0
         return round(milliseconds / (1000 * 60 * 60), 2)
     
+    def _currency_amount(self, total_currencies: List[Dict[str, Any]], currency: str = 'USD') -> Decimal:
+        """Get the amount for a currency from a total_currencies list"""
+        entry = next((c for c in total_currencies if _get_currency(c) == currency), None)
+        return self._safe_decimal(_get_amount(entry)) if entry else Decimal('0')
+    
     async def _get_project_user_rates(self, workspace_id: int, project_id: int, reports_api) -> Dict[int, float]:
         """
         Get user rates for a specific project from the Toggl API
@@ -173,57 +192,34 @@ class AdminDataProcessor:
             # Fallback to default rate
             return Decimal(str(default_rate))
     
-    def _calculate_labor_cost_from_v3_data(self, detailed_entries: List[Dict[str, Any]]) -> Decimal:
+    def _aggregate_v3_data(self, detailed_entries: List[Dict[str, Any]]) -> Tuple[Decimal, Decimal, float]:
         """
-        Calculate total labor cost from Reports API v3 detailed entries
+        Sum revenue, labor cost and hours from Reports API v3 detailed entries in one pass
         
         Args:
             detailed_entries: List of time entries from Reports API v3
             
         Returns:
-            Total labor cost as Decimal
+            Tuple of (total revenue, total labor cost, total hours)
         """
+        total_revenue = Decimal('0')
         total_labor_cost = Decimal('0')
+        total_hours = 0.0
+        labor_share = Decimal(str(self.labor_cost_percentage))
         
         for entry in detailed_entries:
-            # Get billing rate in cents and convert to dollars
-            hourly_rate_cents = entry.get('hourly_rate_in_cents', 0)
-            hourly_rate_dollars = self._safe_decimal(hourly_rate_cents) / Decimal('100')
+            # Billable amount and billing rate are both reported in cents
+            total_revenue += self._safe_decimal(entry.get('billable_amount_in_cents', 0)) / _CENTS
             
-            # Calculate labor cost as percentage of billing rate
-            labor_rate = hourly_rate_dollars * Decimal(str(self.labor_cost_percentage))
+            # Labor cost is a fixed share of the billing rate
+            labor_rate = self._safe_decimal(entry.get('hourly_rate_in_cents', 0)) / _CENTS * labor_share
             
-            # Get time from time_entries array
-            time_entries = entry.get('time_entries', [])
-            for time_entry in time_entries:
+            for time_entry in entry.get('time_entries', []):
                 seconds = time_entry.get('seconds', 0)
-                hours = Decimal(str(seconds)) / Decimal('3600')
-                
-                # Calculate labor cost for this time entry
-                entry_labor_cost = labor_rate * hours
-                total_labor_cost += entry_labor_cost
-        
-        return total_labor_cost
-    
-    def _calculate_revenue_from_v3_data(self, detailed_entries: List[Dict[str, Any]]) -> Decimal:
-        """
-        Calculate total revenue from Reports API v3 detailed entries
-        
-        Args:
-            detailed_entries: List of time entries from Reports API v3
-            
-        Returns:
-            Total revenue as Decimal
-        """
-        total_revenue = Decimal('0')
-        
-        for entry in detailed_entries:
-            # Get billable amount in cents and convert to dollars
-            billable_amount_cents = entry.get('billable_amount_in_cents', 0)
-            billable_amount_dollars = self._safe_decimal(billable_amount_cents) / Decimal('100')
-            total_revenue += billable_amount_dollars
+                total_labor_cost += labor_rate * (Decimal(str(seconds)) / _SECONDS_PER_HOUR)
+                total_hours += seconds / 3600
         
-        return total_revenue
+        return total_revenue, total_labor_cost, total_hours
     
     def process_profitability_from_v3_data(
         self,
@@ -240,8 +236,7 @@ class AdminDataProcessor:
         Returns:
             Dictionary with profitability metrics
         """
-        total_revenue = self._calculate_revenue_from_v3_data(detailed_entries)
-        total_labor_cost = self._calculate_labor_cost_from_v3_data(detailed_entries)
+        total_revenue, total_labor_cost, total_hours = self._aggregate_v3_data(detailed_entries)
         total_profit = total_revenue - total_labor_cost
         
         # Calculate profit margin
@@ -249,15 +244,6 @@ class AdminDataProcessor:
         if total_revenue > 0:
             profit_margin = float((total_profit / total_revenue) * 100)
         
-        # Calculate total hours
-        total_hours = 0.0
-        for entry in detailed_entries:
-            time_entries = entry.get('time_entries', [])
-            for time_entry in time_entries:
-                seconds = time_entry.get('seconds', 0)
-                hours = seconds / 3600
-                total_hours += hours
-        
         # Calculate average hourly rate
         average_hourly_rate = Decimal('0')
         if total_hours > 0:
@@ -313,11 +299,7 @@ class AdminDataProcessor:
         
         # Extract financial data from insights (Toggl Reports API v2 structure)
         total_currencies = insights_data.get('total_currencies', [])
-        total_revenue = Decimal('0')
-        for curr in total_currencies:
-            if curr.get('currency') == 'USD':
-                total_revenue = self._safe_decimal(curr.get('amount', 0))
-                break
+        total_revenue = self._currency_amount(total_currencies, 'USD')
         
         # Calculate total labor cost from all time entries
         total_labor_cost = Decimal('0')
@@ -409,17 +391,13 @@ class AdminDataProcessor:
                     non_billable_hours = total_hours - billable_hours
                 
                 # Extract revenue from total_currencies
-                revenue = Decimal('0')
                 total_currencies = item.get('total_currencies', [])
                 
                 # Debug: Log revenue extraction details
                 logger.debug(f"Project {item.get('id')} total_currencies: {total_currencies}")
                 
-                for curr in total_currencies:
-                    if curr.get('currency') == 'USD':
-                        revenue = self._safe_decimal(curr.get('amount', 0))
-                        logger.debug(f"Project {item.get('id')} USD revenue: ${revenue}")
-                        break
+                revenue = self._currency_amount(total_currencies, 'USD')
+                logger.debug(f"Project {item.get('id')} USD revenue: ${revenue}")
                 
                 if revenue == 0:
                     logger.warning(f"Project {item.get('id')} has zero revenue - checking if this is expected")
@@ -603,27 +581,17 @@ class AdminDataProcessor:
                 # Skip this project and continue with the next one
                 continue
         
-        # Filter out any non-ProjectProfitability objects that might have slipped through
-        valid_projects = []
+        # Callers rely on a homogeneous list of ProjectProfitability objects
         for p in projects:
-            # Check for all required attributes that will be used later
-            required_attrs = ['total_hours', 'profit', 'revenue', 'profit_margin', 'project_name', 
-                            'client_name', 'billable_hours', 'utilization_rate', 'billable_rate', 
-                            'active_users', 'time_entries_count']
-            
-            if all(hasattr(p, attr) for attr in required_attrs):
-                valid_projects.append(p)
-            else:
-                logger.warning(f"Filtering out invalid project object: {type(p)}")
-                missing_attrs = [attr for attr in required_attrs if not hasattr(p, attr)]
-                logger.warning(f"Missing attributes: {missing_attrs}")
+            if not isinstance(p, ProjectProfitability):
+                raise TypeError(f"Expected ProjectProfitability, got {type(p).__name__}")
         
-        if not valid_projects:
-            logger.warning("No valid project objects found after filtering")
+        if not projects:
+            logger.warning("No valid project objects found")
             return []
         
-        logger.info(f"Returning {len(valid_projects)} valid ProjectProfitability objects")
-        return sorted(valid_projects, key=lambda p: float(p.profit or 0), reverse=True)
+        logger.info(f"Returning {len(projects)} valid ProjectProfitability objects")
+        return sorted(projects, key=lambda p: float(p.profit or 0), reverse=True)
     
     def process_employee_profitability(
         self,
@@ -679,12 +647,8 @@ class AdminDataProcessor:
             insights = insights_by_user.get(user_id, {})
             
             # Extract revenue from total_currencies
-            revenue = Decimal('0')
             total_currencies = insights.get('total_currencies', [])
-            for curr in total_currencies:
-                if curr.get('currency') == 'USD':
-                    revenue = self._safe_decimal(curr.get('amount', 0))
-                    break
+            revenue = self._currency_amount(total_currencies, 'USD')
             
             # Calculate labor cost from individual time entries
             labor_cost = Decimal('0')
@@ -717,7 +681,7 @@ class AdminDataProcessor:
             
             employees.append(employee)
         
-        return sorted(employees, key=lambda e: e.utilization_rate, reverse=True)
+        return sorted(employees, key=_get_utilization_rate, reverse=True)
     
     def process_client_profitability(
         self,
@@ -755,12 +719,8 @@ class AdminDataProcessor:
             insights = insights_by_client.get(client_id, {})
             
             # Extract revenue from total_currencies
-            revenue = Decimal('0')
             total_currencies = insights.get('total_currencies', [])
-            for curr in total_currencies:
-                if curr.get('currency') == 'USD':
-                    revenue = self._safe_decimal(curr.get('amount', 0))
-                    break
+            revenue = self._currency_amount(total_currencies, 'USD')
             
             # Calculate labor cost from individual time entries
             labor_cost = Decimal('0')
@@ -794,7 +754,7 @@ class AdminDataProcessor:
             
             clients.append(client)
         
-        return sorted(clients, key=lambda c: c.profit, reverse=True)
+        return sorted(clients, key=_get_profit, reverse=True)
     
     def calculate_team_metrics(
         self,
@@ -816,7 +776,7 @@ class AdminDataProcessor:
         overall_efficiency = (billable_hours / total_capacity * 100) if total_capacity > 0 else 0
         
         # Identify top and underperformers
-        top_performers = sorted(employees, key=lambda e: e.utilization_rate, reverse=True)[:5]
+        top_performers = heapq.nlargest(5, employees, key=_get_utilization_rate)
         underperformers = [e for e in employees if e.utilization_rate < 60.0]
         
         # Calculate team average rate
@@ -910,7 +870,7 @@ class AdminDataProcessor:
         
         most_productive_projects = [
             project for project, _ in 
-            sorted(project_hours.items(), key=lambda x: x[1], reverse=True)[:5]
+            heapq.nlargest(5, project_hours.items(), key=itemgetter(1))
         ]
         
         # Context switching frequency (switches per day)
@@ -936,7 +896,7 @@ class AdminDataProcessor:
         self,
         insights_data: Dict[str, Any],
         currency: str = "USD"
-    ) -> Dict[str, Any]:
+    ) -> ProductivitySummary:
         """Process productivity insights from time tracking data"""
         
         # Extract key metrics from insights data
@@ -967,23 +927,23 @@ class AdminDataProcessor:
         # Calculate average hourly rate
         avg_hourly_rate = float(total_revenue / Decimal(str(billable_hours))) if billable_hours > 0 else 0
         
-        return {
-            'total_hours': total_hours,
-            'billable_hours': billable_hours,
-            'non_billable_hours': non_billable_hours,
-            'total_revenue': float(total_revenue),
-            'utilization_rate': utilization_rate,
-            'efficiency_rate': efficiency_rate,
-            'avg_hourly_rate': avg_hourly_rate,
-            'currency': currency
-        }
+        return ProductivitySummary(
+            total_hours=total_hours,
+            billable_hours=billable_hours,
+            non_billable_hours=non_billable_hours,
+            total_revenue=float(total_revenue),
+            utilization_rate=utilization_rate,
+            efficiency_rate=efficiency_rate,
+            avg_hourly_rate=avg_hourly_rate,
+            currency=currency
+        )
     
     def process_productivity_insights_from_summary(
         self,
         summary_data: Dict[str, Any],
         insights_data: Dict[str, Any],
         currency: str = "USD"
-    ) -> Dict[str, Any]:
+    ) -> ProductivitySummary:
         """Process productivity insights using the same data source as organization dashboard"""
         
         # Extract totals from summary data (same as organization dashboard)
@@ -996,11 +956,7 @@ class AdminDataProcessor:
         
         # Extract financial data from insights (same as organization dashboard)
         total_currencies = insights_data.get('total_currencies', [])
-        total_revenue = Decimal('0')
-        for curr in total_currencies:
-            if curr.get('currency') == 'USD':
-                total_revenue = self._safe_decimal(curr.get('amount', 0))
-                break
+        total_revenue = self._currency_amount(total_currencies, 'USD')
         
         # Calculate productivity metrics
         utilization_rate = (billable_hours / total_hours * 100) if total_hours > 0 else 0
@@ -1009,22 +965,22 @@ class AdminDataProcessor:
         # Calculate average hourly rate
         avg_hourly_rate = float(total_revenue / Decimal(str(billable_hours))) if billable_hours > 0 else 0
         
-        return {
-            'total_hours': total_hours,
-            'billable_hours': billable_hours,
-            'non_billable_hours': non_billable_hours,
-            'total_revenue': float(total_revenue),
-            'utilization_rate': utilization_rate,
-            'efficiency_rate': efficiency_rate,
-            'avg_hourly_rate': avg_hourly_rate,
-            'currency': currency
-        }
+        return ProductivitySummary(
+            total_hours=total_hours,
+            billable_hours=billable_hours,
+            non_billable_hours=non_billable_hours,
+            total_revenue=float(total_revenue),
+            utilization_rate=utilization_rate,
+            efficiency_rate=efficiency_rate,
+            avg_hourly_rate=avg_hourly_rate,
+            currency=currency
+        )
     
     def process_financial_summary(
         self,
         summary_data: Dict[str, Any],
         currency: str = "USD"
-    ) -> Dict[str, Any]:
+    ) -> FinancialSummary:
         """Process financial summary from summary data"""
         
         # Extract totals from summary data (Toggl Reports API v2 structure)
@@ -1038,23 +994,19 @@ class AdminDataProcessor:
         non_billable_hours = total_hours - billable_hours
         
         # Calculate revenue from currencies
-        total_revenue = Decimal('0')
-        for curr in total_currencies:
-            if curr.get('currency') == currency:
-                total_revenue = self._safe_decimal(curr.get('amount', 0))
-                break
+        total_revenue = self._currency_amount(total_currencies, currency)
         
         # Calculate utilization rates
         utilization_rate = (billable_hours / total_hours * 100) if total_hours > 0 else 0
         
-        return {
-            'total_hours': total_hours,
-            'billable_hours': billable_hours,
-            'non_billable_hours': non_billable_hours,
-            'total_revenue': float(total_revenue),
-            'utilization_rate': utilization_rate,
-            'currency': currency
-        }
+        return FinancialSummary(
+            total_hours=total_hours,
+            billable_hours=billable_hours,
+            non_billable_hours=non_billable_hours,
+            total_revenue=float(total_revenue),
+            utilization_rate=utilization_rate,
+            currency=currency
+        )
     
     def process_billing_analysis(
         self,
@@ -1070,25 +1022,35 @@ class AdminDataProcessor:
         # Calculate billing efficiency (simplified - would need actual billing data)
         billing_efficiency = 85.0  # Placeholder - would calculate from actual vs billed
         
-        # Identify rate gaps (projects without proper rates)
-        rate_gaps = [
-            p.project_name for p in projects 
-            if not p.billable_rate or p.billable_rate <= Decimal('10')
-        ]
+        # Identify rate gaps (projects without proper rates) and accumulate
+        # hours per rate tier in a single pass. Rates stay Decimal on the model,
+        # but threshold checks use a float copy since Decimal comparisons are slow.
+        rate_gaps = []
+        tier_hours = {'low': 0.0, 'medium': 0.0, 'high': 0.0}
+        total_hours = 0.0
+        for p in projects:
+            rate_f = float(p.billable_rate) if p.billable_rate else 0.0
+            total_hours += p.total_hours
+            
+            if rate_f <= 10.0:
+                rate_gaps.append(p.project_name)
+            
+            if not rate_f:
+                continue
+            if rate_f < 50.0:
+                tier = 'low'
+            elif rate_f < 100.0:
+                tier = 'medium'
+            else:
+                tier = 'high'
+            tier_hours[tier] += p.total_hours
         
         # Rate utilization analysis
-        rate_tiers = {
-            'low': [p for p in projects if p.billable_rate and p.billable_rate < Decimal('50')],
-            'medium': [p for p in projects if p.billable_rate and Decimal('50') <= p.billable_rate < Decimal('100')],
-            'high': [p for p in projects if p.billable_rate and p.billable_rate >= Decimal('100')]
+        rate_utilization = {
+            tier: (hours / total_hours * 100) if total_hours > 0 else 0
+            for tier, hours in tier_hours.items()
         }
         
-        total_hours = sum(p.total_hours for p in projects)
-        rate_utilization = {}
-        for tier, tier_projects in rate_tiers.items():
-            tier_hours = sum(p.total_hours for p in tier_projects)
-            rate_utilization[tier] = (tier_hours / total_hours * 100) if total_hours > 0 else 0
-        
         # Suggest rate adjustments (simplified logic)
         suggested_adjustments = {}
         for project in projects:
@@ -0,0 +1,47 @@
+"""
+Shared HTTP session for the Toggl Track and Reports API clients
+"""
+import asyncio
+import ssl
+from typing import Optional
+
+import aiohttp
+import certifi
+
+from toggl_server.utils import json_dumps
+
+# Create SSL context with proper certificate verification. Loading the CA bundle is
+# the costly part, and client-side contexts are safe to share, so do it once per process
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+_SSL_CONTEXT.check_hostname = True
+_SSL_CONTEXT.verify_mode = ssl.CERT_REQUIRED
+
+class TogglHTTPClient:
+    """Owns one aiohttp session so both API clients share a connection pool to api.track.toggl.com"""
+    
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self.ssl_context = _SSL_CONTEXT
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it once on first use"""
+        if self.session is None:
+            # Concurrent first calls must not each open a session and connection pool
+            async with self._session_lock:
+                if self.session is None:
+                    connector = aiohttp.TCPConnector(
+                        ssl=self.ssl_context,
+                        limit=100,
+                        limit_per_host=30,
+                        keepalive_timeout=75,
+                        ttl_dns_cache=300
+                    )
+                    self.session = aiohttp.ClientSession(connector=connector, json_serialize=json_dumps)
+        return self.session
+    
+    async def close(self):
+        """Close the aiohttp session"""
+        if self.session:
+            await self.session.close()
+            self.session = None
@@ -2,19 +2,27 @@
 Extended Toggl MCP server with admin-level reporting capabilities
 """
 import asyncio
+import calendar
+import functools
+import heapq
 import os
+import time
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple, Union
 
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 import mcp.server.stdio
 
-from .toggl_api import TogglAPI  # Original basic API
+from .http_client import TogglHTTPClient
+from .toggl_api import TogglAPI, TogglAuthError  # Original basic API
 from .reports_api import TogglReportsAPI  # New reports API
 from .admin_processor import AdminDataProcessor
 from .models import AdminReportData
+from .utils import SingleFlight
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -22,6 +30,149 @@ logger = logging.getLogger(__name__)
 
 server = Server("admin-toggl-mcp")
 
+# Tool handlers take the call arguments and return the response text (or a prebuilt response)
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Union[str, List[TextContent]]]]
+
+# Seconds a Reports API v3 search response is served from memory before refetching
+REPORTS_CACHE_TTL = 60.0
+
+# Seconds workspace metadata (name, default currency) is served from memory before refetching
+WORKSPACE_CACHE_TTL = 300.0
+
+# Seconds the user's default workspace ID is trusted before asking /me again
+DEFAULT_WORKSPACE_TTL = 3600.0
+
+# Static report headers, filled in with str.format
+_CONNECTION_TEST_TEMPLATE = """🔗 **MCP Server Connection Test**
+
+✅ **MCP Server**: Running successfully
+{api_status} **Toggl Track API**
+{reports_status} **Toggl Reports API**
+
+💡 **Note**: If APIs show as not connected, please check your TOGGL_API_TOKEN environment variable."""
+
+_DASHBOARD_HEADER = """🏢 **ORGANIZATION DASHBOARD** - {workspace_name}
+📅 Period: {start} to {end}"""
+
+_PROJECT_REPORT_HEADER = """
+💰 **PROJECT PROFITABILITY ANALYSIS**
+📅 Period: {start} to {end}
+🔍 Showing {count} projects (min {min_hours}h, sorted by {sort_by})
+
+"""
+
+_TEAM_REPORT_HEADER = """
+👥 **TEAM PRODUCTIVITY REPORT**
+📅 Period: {start} to {end}
+🔍 Showing {count} team members
+
+"""
+
+_CLIENT_REPORT_HEADER = """
+💰 **CLIENT PROFITABILITY ANALYSIS**
+📅 Period: {start} to {end}
+🔍 Showing {count} clients
+
+"""
+
+# Per-row report templates
+_PROJECT_ROW_TEMPLATE = """
+**{i}. {name}**
+{client_line}
+   • Hours: {hours:.1f}h total, {billable:.1f}h billable ({util:.1f}% util)
+   • Revenue: {cur} {revenue:,.2f}
+   • Profit: {cur} {profit:,.2f} ({margin:.1f}% margin)
+   • Rate: {cur} {rate:.2f}/hour (avg)
+   • Team: {team} members, {entries} entries
+"""
+
+_TEAM_ROW_TEMPLATE = """
+**{i}. {name}**
+   • Total Hours: {hours:.1f}h
+   • Billable Hours: {billable:.1f}h ({util:.1f}% util)
+   • Revenue: {cur} {revenue:,.2f}
+   • Profit: {cur} {profit:,.2f} ({margin:.1f}% margin)
+   • Rate: {cur} {rate:.2f}/hour (avg)
+   • Projects: {projects}
+"""
+
+_CLIENT_ROW_TEMPLATE = """
+**{i}. {name}**
+   • Total Revenue: {cur} {revenue:,.2f}
+   • Total Profit: {cur} {profit:,.2f} ({margin:.1f}% margin)
+   • Projects: {projects}
+"""
+
+# Full-body templates for the summary tools, rendered with str.format_map
+_FINANCIAL_SUMMARY_TEMPLATE = """
+💰 **FINANCIAL SUMMARY**
+📅 Period: {start} to {end}
+🔍 Showing financial summary for {workspace_name}
+
+
+📊 **FINANCIAL SUMMARY**
+• Total Hours: {total_hours:,.1f}h
+• Billable Hours: {billable_hours:,.1f}h
+• Non-Billable Hours: {non_billable_hours:,.1f}h
+• Total Revenue: {currency} {total_revenue:,.2f}
+• Utilization Rate: {utilization_rate:.1f}%
+"""
+
+_FINANCIAL_COMPARISON_TEXT = """
+📈 **COMPARISON WITH PREVIOUS PERIOD**
+• This feature is currently being enhanced to provide period-over-period comparisons.
+• Current focus is on current period financial metrics.
+"""
+
+_INSIGHTS_TEMPLATE = """
+💡 **PRODUCTIVITY INSIGHTS**
+📅 Period: {start} to {end}
+🔍 Showing productivity insights for {workspace_name}
+
+
+📊 **TIME TRACKING PATTERNS**
+• Total Hours: {total_hours:,.1f}h
+• Average Hourly Rate: {currency} {average_hourly_rate:.2f}
+
+📊 **PROFITABILITY METRICS**
+• Total Revenue: {currency} {total_revenue:,.2f}
+• Total Labor Cost: {currency} {total_labor_cost:,.2f}
+• Total Profit: {currency} {total_profit:,.2f}
+• Profit Margin: {profit_margin:.1f}%
+• Labor Cost %: {labor_cost_percentage:.0%} of billing rate
+"""
+
+_INSIGHTS_DETAIL_TEXT = """
+📊 **DETAILED ANALYSIS**
+• This feature is currently being enhanced to provide more detailed insights.
+• Current focus is on high-level productivity metrics and utilization rates.
+"""
+
+# Process-wide API clients, shared by every AdminTogglServer so the underlying
+# HTTP connection pools (and their keep-alive connections) are reused
+_http_client: Optional[TogglHTTPClient] = None  # One session, so both clients share a pool per host
+_toggl_api: Optional[TogglAPI] = None
+_reports_api: Optional[TogglReportsAPI] = None
+_api_lock = asyncio.Lock()
+
+def get_toggl_api() -> Optional[TogglAPI]:
+    """Get the shared Track API client, if initialized"""
+    return _toggl_api
+
+def get_reports_api() -> Optional[TogglReportsAPI]:
+    """Get the shared Reports API client, if initialized"""
+    return _reports_api
+
+async def close_apis():
+    """Close the shared API clients and their HTTP session"""
+    global _http_client, _toggl_api, _reports_api
+    async with _api_lock:
+        _toggl_api = None
+        _reports_api = None
+        if _http_client is not None:
+            await _http_client.close()
+            _http_client = None
+
 class AdminTogglServer:
     """Extended Toggl MCP server with admin-level analytics"""
     
@@ -29,329 +180,515 @@ class AdminTogglServer:
         self.toggl_api: Optional[TogglAPI] = None
         self.reports_api: Optional[TogglReportsAPI] = None
         self.processor = AdminDataProcessor()
-        self.workspaces_cache = {}
+        self.workspaces_cache: Dict[int, tuple] = {}  # workspace_id -> (fetched_at, workspace)
+        self._reports_cache: Dict[tuple, tuple] = {}  # key -> (fetched_at, response)
+        self._inflight = SingleFlight()  # Reports API fetches shared by concurrent callers
+        self._cache_cleanup_task: Optional[asyncio.Task] = None
+        self._pending_ws = SingleFlight()  # workspace lookups in progress, by workspace_id
+        self._default_workspace: Optional[tuple] = None  # (fetched_at, default_workspace_id)
+        self._workspace_listing: Optional[tuple] = None  # (fetched_at, rendered list_workspaces response)
+        self._initialized_token: Optional[str] = None  # token of the last successful initialize_apis
     
     async def initialize_apis(self, api_token: str):
         """Initialize both Track API and Reports API"""
+        global _http_client, _toggl_api, _reports_api
+        # Repeat calls with the same token reuse the live clients and warmed caches,
+        # unless close_apis has torn the shared clients down since
+        if api_token == self._initialized_token and _toggl_api is not None and self.toggl_api is _toggl_api:
+            return
+        if api_token != self._initialized_token:
+            self._reset_account_caches()
+        
         try:
-            self.toggl_api = TogglAPI(api_token)
-            self.reports_api = TogglReportsAPI(api_token)
+            async with _api_lock:
+                # Clients authenticate per request, so a token change keeps the shared session
+                if _http_client is None:
+                    _http_client = TogglHTTPClient()
+                if _toggl_api is None or _toggl_api.api_token != api_token:
+                    _toggl_api = TogglAPI(api_token, _http_client)
+                if _reports_api is None or _reports_api.api_token != api_token:
+                    _reports_api = TogglReportsAPI(api_token, _http_client)
+            self.toggl_api = _toggl_api
+            self.reports_api = _reports_api
             
-            # Cache workspace info
-            workspaces = await self.toggl_api.get_workspaces()
-            self.workspaces_cache = {ws.id: ws for ws in workspaces}
+            # Cache workspace info as plain dicts, the same shape get_workspace returns,
+            # while warming the default workspace used by start_tracking
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    workspaces_task = tg.create_task(self.toggl_api.get_workspaces())
+                    tg.create_task(self._prefetch_default_workspace())
+            except ExceptionGroup as eg:
+                # Surface the underlying API error rather than the group wrapper
+                raise eg.exceptions[0]
+            workspaces = workspaces_task.result()
+            fetched_at = time.monotonic()
+            self.workspaces_cache = {ws.id: (fetched_at, asdict(ws)) for ws in workspaces}
+            self._initialized_token = api_token
             
             logger.info("Admin Toggl APIs initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize APIs: {e}")
             raise
     
+    def _reset_account_caches(self):
+        """Forget data cached for the previous token's account"""
+        # Fresh containers rather than clear(), so fetches still in flight for the
+        # old account finish into the discarded ones
+        self.workspaces_cache = {}
+        self._reports_cache = {}
+        self._inflight = SingleFlight()
+        self._pending_ws = SingleFlight()
+        self._default_workspace = None
+        self._workspace_listing = None
+    
     async def get_workspace_info(self, workspace_id: int) -> Dict[str, Any]:
         """Get workspace information with caching"""
-        if workspace_id in self.workspaces_cache:
-            return self.workspaces_cache[workspace_id]
+        cached = self.workspaces_cache.get(workspace_id)
+        if cached is not None and time.monotonic() - cached[0] < WORKSPACE_CACHE_TTL:
+            return cached[1]
+        
+        # Fallback to API call, shared by concurrent lookups of the same workspace
+        cache = self.workspaces_cache
+        return await self._pending_ws.run(workspace_id, lambda: self._fetch_workspace(workspace_id, cache))
+    
+    async def get_default_workspace_id(self) -> Optional[int]:
+        """Get the user's default workspace ID, cached for DEFAULT_WORKSPACE_TTL or until the token is rejected"""
+        cached = self._default_workspace
+        if cached is not None and time.monotonic() - cached[0] < DEFAULT_WORKSPACE_TTL:
+            return cached[1]
         
-        # Fallback to API call
+        toggl_api = self.toggl_api
+        try:
+            user_info = await toggl_api.get_user_info()
+        except TogglAuthError:
+            # The token was rejected, so the workspace cached for it can't be trusted either
+            self._default_workspace = None
+            raise
+        workspace_id = user_info.get("default_workspace_id")
+        # Don't cache an answer for a token that was replaced while /me was in flight
+        if self.toggl_api is toggl_api:
+            self._default_workspace = (time.monotonic(), workspace_id)
+        return workspace_id
+    
+    async def _prefetch_default_workspace(self):
+        """Warm the default workspace cache; start_tracking looks it up on demand if this fails"""
+        try:
+            await self.get_default_workspace_id()
+        except Exception as e:
+            logger.warning(f"Could not prefetch default workspace: {e}")
+    
+    async def get_workspace_listing(self) -> List[TextContent]:
+        """Get the rendered list_workspaces response, cached for WORKSPACE_CACHE_TTL"""
+        cached = self._workspace_listing
+        if cached is not None and time.monotonic() - cached[0] < WORKSPACE_CACHE_TTL:
+            return cached[1]
+        
+        toggl_api = self.toggl_api
+        workspaces = await toggl_api.get_workspaces()
+        workspace_list = "\n".join([f"• {ws.name} (ID: {ws.id})" for ws in workspaces])
+        listing = [TextContent(type="text", text=f"Available workspaces:\n{workspace_list}")]
+        # Don't cache a listing for a token that was replaced while it was being fetched
+        if self.toggl_api is toggl_api:
+            self._workspace_listing = (time.monotonic(), listing)
+        return listing
+    
+    async def _fetch_workspace(self, workspace_id: int, cache: Dict[int, tuple]) -> Dict[str, Any]:
+        """Fetch a workspace missing from the cache and store it in cache"""
         try:
             workspace = await self.toggl_api.get_workspace(workspace_id)
-            self.workspaces_cache[workspace_id] = workspace
+            cache[workspace_id] = (time.monotonic(), workspace)
             return workspace
         except Exception as e:
             logger.error(f"Failed to get workspace {workspace_id}: {e}")
             return {"id": workspace_id, "name": "Unknown", "default_currency": "USD"}
+    
+    async def _cached_call(self, key: tuple, coro_factory, ttl: float = REPORTS_CACHE_TTL) -> Any:
+        """Return a cached Reports API response, fetching it via coro_factory when missing or expired"""
+        cached = self._reports_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        reports_cache = self._reports_cache
+        
+        async def fetch() -> Any:
+            result = await coro_factory()
+            reports_cache[key] = (time.monotonic(), result)
+            self._ensure_cache_cleanup()
+            return result
+        
+        # Single-flight: concurrent callers for the same key share one upstream request
+        return await self._inflight.run(key, fetch)
+    
+    def _ensure_cache_cleanup(self):
+        """Start the background sweep of expired cache entries if it isn't running"""
+        if self._cache_cleanup_task is None or self._cache_cleanup_task.done():
+            self._cache_cleanup_task = asyncio.create_task(self._cleanup_reports_cache())
+    
+    async def _cleanup_reports_cache(self, interval: float = REPORTS_CACHE_TTL):
+        """Periodically drop expired Reports API responses"""
+        while self._reports_cache:
+            await asyncio.sleep(interval)
+            cutoff = time.monotonic() - REPORTS_CACHE_TTL
+            expired = [key for key, (fetched_at, _) in self._reports_cache.items() if fetched_at < cutoff]
+            for key in expired:
+                del self._reports_cache[key]
+            if expired:
+                logger.debug(f"Evicted {len(expired)} expired Reports API cache entries")
+    
+    # Summary and insights GETs are cached (and ETag-revalidated) by TogglReportsAPI itself;
+    # only the v3 search POST, which it does not cache, goes through _cached_call
+    async def get_detailed_report_v3(self, workspace_id: int, start_date: str, end_date: str, hide_amounts: bool = False) -> Dict[str, Any]:
+        """Get Reports API v3 detailed entries through the response cache"""
+        return await self._cached_call(
+            ("detailed_v3", workspace_id, start_date, end_date, hide_amounts),
+            lambda: self.reports_api.get_detailed_report_v3(workspace_id, start_date, end_date, hide_amounts)
+        )
 
 # Initialize server instance
 admin_server = AdminTogglServer()
 
+# Tool definitions are static, so build them once at import time
+_TOOLS: List[Tool] = [
+    # Original basic tools
+    Tool(
+        name="start_tracking",
+        description="Start tracking time for a new task",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Title/description of the task"},
+                "workspace_id": {"type": "integer", "description": "Workspace ID (optional)"},
+                "project_id": {"type": "integer", "description": "Project ID (optional)"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "List of tags (optional)"}
+            },
+            "required": ["title"]
+        }
+    ),
+    Tool(
+        name="stop_tracking",
+        description="Stop the currently running time entry",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="show_current_time_entry",
+        description="Show the currently running time entry",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="list_workspaces",
+        description="List all available workspaces",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="test_connection",
+        description="Test the MCP server connection and API status",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    
+    # New admin-level tools
+    Tool(
+        name="get_organization_dashboard",
+        description="Get comprehensive organization dashboard with KPIs, hours, revenue, and profit metrics",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "period": {"type": "string", "enum": ["week", "month", "quarter", "year"], "description": "Predefined period (optional)"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_project_profitability_analysis",
+        description="Get detailed project profitability analysis with profit margins, utilization rates, and ROI",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "sort_by": {"type": "string", "enum": ["profit", "revenue", "margin", "hours"], "description": "Sort criterion"},
+                "min_hours": {"type": "number", "description": "Minimum hours threshold for inclusion"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_team_productivity_report",
+        description="Get team productivity report with utilization rates, performance metrics, and capacity analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "include_individual_metrics": {"type": "boolean", "description": "Include individual employee metrics"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_client_profitability_analysis",
+        description="Get client-level profitability and revenue analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "min_revenue": {"type": "number", "description": "Minimum revenue threshold"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_financial_summary",
+        description="Get high-level financial summary with revenue, costs, and profit trends",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "period": {"type": "string", "enum": ["month", "quarter", "year"], "description": "Period for analysis"},
+                "compare_previous": {"type": "boolean", "description": "Include comparison with previous period"}
+            },
+            "required": ["workspace_id"]
+        }
+    ),
+    Tool(
+        name="get_productivity_insights",
+        description="Get advanced productivity insights and time tracking patterns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_id": {"type": "integer", "description": "Workspace ID"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "include_detailed_analysis": {"type": "boolean", "description": "Include detailed time entry analysis"}
+            },
+            "required": ["workspace_id"]
+        }
+    )
+]
+
+# _TOOLS is already built once, so this stays a plain coroutine - functools.cache
+# would memoize the coroutine object, which can only be awaited once
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """List all available tools including admin capabilities"""
-    return [
-        # Original basic tools
-        Tool(
-            name="start_tracking",
-            description="Start tracking time for a new task",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Title/description of the task"},
-                    "workspace_id": {"type": "integer", "description": "Workspace ID (optional)"},
-                    "project_id": {"type": "integer", "description": "Project ID (optional)"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "List of tags (optional)"}
-                },
-                "required": ["title"]
-            }
-        ),
-        Tool(
-            name="stop_tracking",
-            description="Stop the currently running time entry",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="show_current_time_entry",
-            description="Show the currently running time entry",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="list_workspaces",
-            description="List all available workspaces",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="test_connection",
-            description="Test the MCP server connection and API status",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        
-        # New admin-level tools
-        Tool(
-            name="get_organization_dashboard",
-            description="Get comprehensive organization dashboard with KPIs, hours, revenue, and profit metrics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "period": {"type": "string", "enum": ["week", "month", "quarter", "year"], "description": "Predefined period (optional)"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_project_profitability_analysis",
-            description="Get detailed project profitability analysis with profit margins, utilization rates, and ROI",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "sort_by": {"type": "string", "enum": ["profit", "revenue", "margin", "hours"], "description": "Sort criterion"},
-                    "min_hours": {"type": "number", "description": "Minimum hours threshold for inclusion"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_team_productivity_report",
-            description="Get team productivity report with utilization rates, performance metrics, and capacity analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "include_individual_metrics": {"type": "boolean", "description": "Include individual employee metrics"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_client_profitability_analysis",
-            description="Get client-level profitability and revenue analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "min_revenue": {"type": "number", "description": "Minimum revenue threshold"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_financial_summary",
-            description="Get high-level financial summary with revenue, costs, and profit trends",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "period": {"type": "string", "enum": ["month", "quarter", "year"], "description": "Period for analysis"},
-                    "compare_previous": {"type": "boolean", "description": "Include comparison with previous period"}
-                },
-                "required": ["workspace_id"]
-            }
-        ),
-        Tool(
-            name="get_productivity_insights",
-            description="Get advanced productivity insights and time tracking patterns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_id": {"type": "integer", "description": "Workspace ID"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "include_detailed_analysis": {"type": "boolean", "description": "Include detailed time entry analysis"}
-                },
-                "required": ["workspace_id"]
-            }
-        )
-    ]
+    return _TOOLS
+
+def _month_end(day: date) -> date:
+    """Last day of the month containing day"""
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+def _week_range(today: date) -> Tuple[date, date]:
+    start = today - timedelta(days=today.weekday())  # Monday
+    return start, start + timedelta(days=6)  # Sunday
+
+def _month_range(today: date) -> Tuple[date, date]:
+    return today.replace(day=1), _month_end(today)
+
+def _quarter_range(today: date) -> Tuple[date, date]:
+    quarter_start_month = ((today.month - 1) // 3) * 3 + 1
+    start = today.replace(month=quarter_start_month, day=1)
+    return start, _month_end(start.replace(month=quarter_start_month + 2))
+
+def _year_range(today: date) -> Tuple[date, date]:
+    return today.replace(month=1, day=1), today.replace(month=12, day=31)
+
+# Period name -> (start, end) builder; unknown periods default to the current month
+_PERIOD_RANGES: Dict[str, Callable[[date], Tuple[date, date]]] = {
+    "week": _week_range,
+    "month": _month_range,
+    "quarter": _quarter_range,
+    "year": _year_range,
+}
 
 def _calculate_date_range(period: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None):
     """Calculate date range based on period or explicit dates"""
     if start_date and end_date:
         return start_date, end_date
     
-    today = datetime.now().date()
-    
-    if period == "week":
-        start = today - timedelta(days=today.weekday())  # Monday
-        end = start + timedelta(days=6)  # Sunday
-    elif period == "month":
-        start = today.replace(day=1)
-        next_month = start.replace(month=start.month + 1) if start.month < 12 else start.replace(year=start.year + 1, month=1)
-        end = next_month - timedelta(days=1)
-    elif period == "quarter":
-        quarter_start_month = ((today.month - 1) // 3) * 3 + 1
-        start = today.replace(month=quarter_start_month, day=1)
-        end = (start + timedelta(days=90)).replace(day=1) - timedelta(days=1)
-    elif period == "year":
-        start = today.replace(month=1, day=1)
-        end = today.replace(month=12, day=31)
-    else:
-        # Default to current month
-        start = today.replace(day=1)
-        if today.month == 12:
-            end = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            end = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-    
+    # Keyed on today's ordinal so cached ranges roll over at midnight
+    return _period_date_range(period, date.today().toordinal())
+
+@functools.lru_cache(maxsize=64)
+def _period_date_range(period: Optional[str], today_ordinal: int) -> Tuple[str, str]:
+    """Formatted (start, end) range of the period containing the given day"""
+    start, end = _PERIOD_RANGES.get(period, _month_range)(date.fromordinal(today_ordinal))
     return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
 
+def _summary_totals(items: List[Any]) -> Tuple[Any, Any, float]:
+    """Total revenue, total profit and average margin of report rows, in a single pass"""
+    total_revenue = total_profit = total_margin = 0
+    for item in items:
+        total_revenue += item.revenue
+        total_profit += item.profit
+        total_margin += item.profit_margin
+    return total_revenue, total_profit, total_margin / len(items)
+
+def _raise_first_error(results: List[Any]) -> None:
+    """Re-raise the first exception captured by asyncio.gather(return_exceptions=True)"""
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+# Fixed responses, built once - MCP serializes and discards them, so sharing is safe
+_TRACK_API_ERROR = [TextContent(type="text", text="Error: Toggl API not initialized. Please check your API token.")]
+_REPORTS_API_ERROR = [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your API token.")]
+_CONNECTION_STATUS = {True: "✅ Connected", False: "❌ Not connected"}
+_CONNECTION_TEST_RESULTS = {
+    (track, reports): [TextContent(type="text", text=_CONNECTION_TEST_TEMPLATE.format(
+        api_status=_CONNECTION_STATUS[track], reports_status=_CONNECTION_STATUS[reports]
+    ))]
+    for track in (True, False)
+    for reports in (True, False)
+}
+
+def require_track_api(handler: ToolHandler) -> ToolHandler:
+    """Return the uninitialized-API error instead of calling the handler when the Track API is missing"""
+    @functools.wraps(handler)
+    async def wrapper(arguments: Dict[str, Any]) -> Union[str, List[TextContent]]:
+        if not get_toggl_api():
+            return _TRACK_API_ERROR
+        return await handler(arguments)
+    return wrapper
+
+def require_reports_api(handler: ToolHandler) -> ToolHandler:
+    """Return the uninitialized-API error instead of calling the handler when the Reports API is missing"""
+    @functools.wraps(handler)
+    async def wrapper(arguments: Dict[str, Any]) -> Union[str, List[TextContent]]:
+        if not get_reports_api():
+            return _REPORTS_API_ERROR
+        return await handler(arguments)
+    return wrapper
+
+# Basic tools (original functionality)
+@require_track_api
+async def _start_tracking(arguments: Dict[str, Any]) -> str:
+    workspace_id = arguments.get("workspace_id") or await admin_server.get_default_workspace_id()
+    result = await get_toggl_api().start_time_entry(
+        arguments["title"],
+        workspace_id,
+        arguments.get("project_id"),
+        arguments.get("tags", [])
+    )
+    return f"Started tracking: {result}"
+
+@require_track_api
+async def _stop_tracking(arguments: Dict[str, Any]) -> str:
+    result = await get_toggl_api().stop_current_time_entry()
+    return f"Stopped tracking: {result}"
+
+@require_track_api
+async def _show_current_time_entry(arguments: Dict[str, Any]) -> str:
+    result = await get_toggl_api().get_current_time_entry()
+    return f"Current entry: {result}"
+
+@require_track_api
+async def _list_workspaces(arguments: Dict[str, Any]) -> List[TextContent]:
+    return await admin_server.get_workspace_listing()
+
+async def _test_connection(arguments: Dict[str, Any]) -> List[TextContent]:
+    return _CONNECTION_TEST_RESULTS[bool(get_toggl_api()), bool(get_reports_api())]
+
+# Admin tools (new functionality)
+@require_reports_api
+async def _organization_dashboard(arguments: Dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        arguments.get("period"),
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_organization_dashboard(arguments["workspace_id"], start_date, end_date)
+
+@require_reports_api
+async def _project_profitability_analysis(arguments: Dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_project_profitability_analysis(
+        arguments["workspace_id"], start_date, end_date,
+        arguments.get("sort_by", "profit"),
+        arguments.get("min_hours", 0)
+    )
+
+@require_reports_api
+async def _team_productivity_report(arguments: Dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_team_productivity_report(
+        arguments["workspace_id"], start_date, end_date,
+        arguments.get("include_individual_metrics", True)
+    )
+
+@require_reports_api
+async def _client_profitability_analysis(arguments: Dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_client_profitability_analysis(
+        arguments["workspace_id"], start_date, end_date,
+        arguments.get("min_revenue", 0)
+    )
+
+@require_reports_api
+async def _financial_summary(arguments: Dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(arguments.get("period", "month"))
+    return await _get_financial_summary(
+        arguments["workspace_id"], start_date, end_date,
+        arguments.get("compare_previous", False)
+    )
+
+@require_reports_api
+async def _productivity_insights(arguments: Dict[str, Any]) -> str:
+    start_date, end_date = _calculate_date_range(
+        None,
+        arguments.get("start_date"),
+        arguments.get("end_date")
+    )
+    return await _get_productivity_insights(
+        arguments["workspace_id"], start_date, end_date,
+        arguments.get("include_detailed_analysis", False)
+    )
+
+# Tool name -> handler, built once at import time so dispatch is a single lookup
+_HANDLERS: Dict[str, ToolHandler] = {
+    "start_tracking": _start_tracking,
+    "stop_tracking": _stop_tracking,
+    "show_current_time_entry": _show_current_time_entry,
+    "list_workspaces": _list_workspaces,
+    "test_connection": _test_connection,
+    "get_organization_dashboard": _organization_dashboard,
+    "get_project_profitability_analysis": _project_profitability_analysis,
+    "get_team_productivity_report": _team_productivity_report,
+    "get_client_profitability_analysis": _client_profitability_analysis,
+    "get_financial_summary": _financial_summary,
+    "get_productivity_insights": _productivity_insights,
+}
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool calls for both basic and admin functionality"""
     
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
     try:
-        # Basic tools (original functionality)
-        if name == "start_tracking":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your API token.")]
-            result = await admin_server.toggl_api.start_time_entry(
-                arguments["title"],
-                arguments.get("workspace_id"),
-                arguments.get("project_id"),
-                arguments.get("tags", [])
-            )
-            return [TextContent(type="text", text=f"Started tracking: {result}")]
-        
-        elif name == "stop_tracking":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your API token.")]
-            result = await admin_server.toggl_api.stop_current_time_entry()
-            return [TextContent(type="text", text=f"Stopped tracking: {result}")]
-        
-        elif name == "show_current_time_entry":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your API token.")]
-            result = await admin_server.toggl_api.get_current_time_entry()
-            return [TextContent(type="text", text=f"Current entry: {result}")]
-        
-        elif name == "list_workspaces":
-            if not admin_server.toggl_api:
-                return [TextContent(type="text", text="Error: Toggl API not initialized. Please check your API token.")]
-            workspaces = await admin_server.toggl_api.get_workspaces()
-            workspace_list = "\n".join([f"• {ws.name} (ID: {ws.id})" for ws in workspaces])
-            return [TextContent(type="text", text=f"Available workspaces:\n{workspace_list}")]
-        
-        elif name == "test_connection":
-            api_status = "✅ Connected" if admin_server.toggl_api else "❌ Not connected"
-            reports_status = "✅ Connected" if admin_server.reports_api else "❌ Not connected"
-            return [TextContent(type="text", text=f"""🔗 **MCP Server Connection Test**
-
-✅ **MCP Server**: Running successfully
-{api_status} **Toggl Track API**
-{reports_status} **Toggl Reports API**
-
-💡 **Note**: If APIs show as not connected, please check your TOGGL_API_TOKEN environment variable.""")]
-        
-        # Admin tools (new functionality)
-        elif name == "get_organization_dashboard":
-            if not admin_server.reports_api:
-                return [TextContent(type="text", text="Error: Toggl Reports API not initialized. Please check your API token.")]
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                arguments.get("period"),
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_organization_dashboard(workspace_id, start_date, end_date)
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_project_profitability_analysis":
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_project_profitability_analysis(
-                workspace_id, start_date, end_date,
-                arguments.get("sort_by", "profit"),
-                arguments.get("min_hours", 0)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_team_productivity_report":
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_team_productivity_report(
-                workspace_id, start_date, end_date,
-                arguments.get("include_individual_metrics", True)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_client_profitability_analysis":
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_client_profitability_analysis(
-                workspace_id, start_date, end_date,
-                arguments.get("min_revenue", 0)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        elif name == "get_financial_summary":
-            workspace_id = arguments["workspace_id"]
-            period = arguments.get("period", "month")
-            start_date, end_date = _calculate_date_range(period)
-            
-            result = await _get_financial_summary(
-                workspace_id, start_date, end_date,
-                arguments.get("compare_previous", False)
-            )
+        result = await handler(arguments)
+        if isinstance(result, str):
             return [TextContent(type="text", text=result)]
-        
-        elif name == "get_productivity_insights":
-            workspace_id = arguments["workspace_id"]
-            start_date, end_date = _calculate_date_range(
-                None,
-                arguments.get("start_date"),
-                arguments.get("end_date")
-            )
-            
-            result = await _get_productivity_insights(
-                workspace_id, start_date, end_date,
-                arguments.get("include_detailed_analysis", False)
-            )
-            return [TextContent(type="text", text=result)]
-        
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return result
     
     except Exception as e:
         logger.error(f"Error in tool {name}: {e}")
@@ -360,39 +697,27 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
 async def _get_organization_dashboard(workspace_id: int, start_date: str, end_date: str) -> str:
     """Get comprehensive organization dashboard"""
     try:
-        # Get workspace info
-        workspace_info = await admin_server.get_workspace_info(workspace_id)
-        
-        # Get summary data
-        summary_data = await admin_server.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "projects"
-        )
-        
-        # Get detailed entries from Reports API v3 for accurate profitability calculations
-        detailed_entries = await admin_server.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
-        )
-        
-        # Get insights data (keeping for compatibility)
-        insights_data = await admin_server.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "projects"
-        )
-        
-        # Get user data
-        user_summary = await admin_server.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "users"
-        )
-        user_insights = await admin_server.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "users"
-        )
-        
-        # Get client data  
-        client_summary = await admin_server.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "clients"
-        )
-        client_insights = await admin_server.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "clients"
+        # Fetch workspace info and all report data concurrently - the calls are
+        # independent, so wall time is bounded by the slowest round trip
+        results = await asyncio.gather(
+            admin_server.get_workspace_info(workspace_id),
+            # Summary data
+            admin_server.reports_api.get_summary_report(workspace_id, start_date, end_date, "projects"),
+            # Detailed entries from Reports API v3 for accurate profitability calculations
+            admin_server.get_detailed_report_v3(workspace_id, start_date, end_date, hide_amounts=False),
+            # Insights data (keeping for compatibility)
+            admin_server.reports_api.get_insights_profitability(workspace_id, start_date, end_date, "projects"),
+            # User data
+            admin_server.reports_api.get_summary_report(workspace_id, start_date, end_date, "users"),
+            admin_server.reports_api.get_insights_profitability(workspace_id, start_date, end_date, "users"),
+            # Client data
+            admin_server.reports_api.get_summary_report(workspace_id, start_date, end_date, "clients"),
+            admin_server.reports_api.get_insights_profitability(workspace_id, start_date, end_date, "clients"),
+            return_exceptions=True
         )
+        _raise_first_error(results)
+        (workspace_info, summary_data, detailed_entries, insights_data,
+         user_summary, user_insights, client_summary, client_insights) = results
         
         # Process into admin report (keeping existing structure for now)
         admin_report = admin_server.processor.create_admin_report(
@@ -404,17 +729,17 @@ async def _get_organization_dashboard(workspace_id: int, start_date: str, end_da
         # Process profitability data from Reports API v3
         org = admin_report.organization_summary
         profitability_data = admin_server.processor.process_profitability_from_v3_data(detailed_entries, org.currency)
+        currency = org.currency
         
         return f"""
-🏢 **ORGANIZATION DASHBOARD** - {org.workspace_name}
-📅 Period: {start_date} to {end_date}
+{_DASHBOARD_HEADER.format(workspace_name=org.workspace_name, start=start_date, end=end_date)}
 
 📊 **KEY METRICS**
 • Total Hours: {profitability_data['total_hours']:,.1f}h
-• Total Revenue: {org.currency} {profitability_data['total_revenue']:,.2f}
-• Total Labor Cost: {org.currency} {profitability_data['total_labor_cost']:,.2f}
-• Total Profit: {org.currency} {profitability_data['total_profit']:,.2f} ({profitability_data['profit_margin']:.1f}% margin)
-• Average Rate: {org.currency} {profitability_data['average_hourly_rate']:.2f}/hour
+• Total Revenue: {currency} {profitability_data['total_revenue']:,.2f}
+• Total Labor Cost: {currency} {profitability_data['total_labor_cost']:,.2f}
+• Total Profit: {currency} {profitability_data['total_profit']:,.2f} ({profitability_data['profit_margin']:.1f}% margin)
+• Average Rate: {currency} {profitability_data['average_hourly_rate']:.2f}/hour
 • Labor Cost %: {profitability_data['labor_cost_percentage']*100:.0f}% of billing rate
 
 🎯 **ORGANIZATIONAL HEALTH**
@@ -426,145 +751,92 @@ async def _get_organization_dashboard(workspace_id: int, start_date: str, end_da
 • Avg Hours/Person: {org.average_user_hours:.1f}h
 
 💼 **TOP PROJECTS** (by profit)
-{chr(10).join([f"• {p.project_name}: {org.currency} {p.profit:,.2f} ({p.profit_margin:.1f}% margin)" for p in admin_report.get_top_projects_by_profit(5)])}
+{chr(10).join(f"• {p.project_name}: {currency} {p.profit:,.2f} ({p.profit_margin:.1f}% margin)" for p in admin_report.get_top_projects_by_profit(5))}
 
 👥 **TOP PERFORMERS** (by utilization)
-{chr(10).join([f"• {e.username}: {e.utilization_rate:.1f}% utilization, {e.total_hours:.1f}h" for e in admin_report.get_top_employees_by_utilization(5)])}
+{chr(10).join(f"• {e.username}: {e.utilization_rate:.1f}% utilization, {e.total_hours:.1f}h" for e in admin_report.get_top_employees_by_utilization(5))}
 
 ⚠️ **AREAS FOR ATTENTION**
-{chr(10).join([f"• {p.project_name}: {p.profit_margin:.1f}% margin (low profitability)" for p in admin_report.get_underperforming_projects(20)[:3]])}
+{chr(10).join(f"• {p.project_name}: {p.profit_margin:.1f}% margin (low profitability)" for p in admin_report.get_underperforming_projects(20)[:3])}
         """.strip()
         
     except Exception as e:
         return f"Failed to get organization dashboard: {str(e)}"
 
+# Project attributes for each supported sort_by value ("profit" is the processor's default order)
+_PROJECT_SORT_ATTRS = {
+    "revenue": "revenue",
+    "margin": "profit_margin",
+    "hours": "total_hours",
+}
+
 async def _get_project_profitability_analysis(workspace_id: int, start_date: str, end_date: str, sort_by: str, min_hours: float) -> str:
     """Get detailed project profitability analysis"""
     try:
-        print("🚀 VERSION 1.0.16 BULLETPROOF ANALYSIS STARTING! 🚀", flush=True)
-        logger.info(f"🚀 VERSION 1.0.16: Starting project profitability analysis: workspace_id={workspace_id}, sort_by={sort_by}, min_hours={min_hours}")
-        
         insights_data = await admin_server.reports_api.get_insights_profitability(
             workspace_id, start_date, end_date, "projects"
         )
         
-        print(f"✅ VERSION 1.0.16: Got insights data successfully", flush=True)
-        logger.info(f"✅ VERSION 1.0.16: Got insights data successfully")
-        
         # Debug: Check the API response structure
-        logger.info(f"Insights data keys: {list(insights_data.keys())}")
-        logger.info(f"Data array length: {len(insights_data.get('data', []))}")
-        if insights_data.get('data'):
-            logger.info(f"First data item keys: {list(insights_data['data'][0].keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Insights data keys: %s", list(insights_data.keys()))
+            logger.debug("Data array length: %d", len(insights_data.get('data', [])))
+            if insights_data.get('data'):
+                logger.debug("First data item keys: %s", list(insights_data['data'][0].keys()))
         
         workspace_info = await admin_server.get_workspace_info(workspace_id)
         currency = workspace_info.get('default_currency', 'USD')
         
-        projects = admin_server.processor.process_project_profitability(insights_data, currency)
+        projects = await admin_server.processor.process_project_profitability(
+            insights_data, currency, workspace_id, admin_server.reports_api
+        )
         
-        logger.info(f"Received {len(projects)} valid ProjectProfitability objects from processor")
+        logger.debug("Received %d valid ProjectProfitability objects from processor", len(projects))
         
-        # Filter by minimum hours with bulletproof error handling
+        # Filter by minimum hours
         if min_hours > 0:
-            filtered_projects = []
-            for p in projects:
-                try:
-                    # Handle both dict and object cases
-                    if hasattr(p, 'total_hours'):
-                        hours = float(p.total_hours or 0)
-                    elif isinstance(p, dict):
-                        hours = float(p.get('total_hours', 0))
-                    else:
-                        logger.warning(f"Unknown project type: {type(p)}")
-                        continue
-                        
-                    if hours >= min_hours:
-                        filtered_projects.append(p)
-                except Exception as e:
-                    print(f"🔧 VERSION 1.0.16: Error filtering project: {str(e)}, type: {type(p)}", flush=True)
-                    logger.error(f"🔧 VERSION 1.0.16: Error filtering project: {str(e)}, type: {type(p)}")
-                    continue
-                    
-            projects = filtered_projects
-            logger.info(f"After min_hours filter ({min_hours}h): {len(projects)} projects")
-        
-        # Sort by specified criterion with bulletproof error handling
-        def safe_sort_key(p, attr_name, default=0):
-            try:
-                if hasattr(p, attr_name):
-                    value = getattr(p, attr_name, default)
-                elif isinstance(p, dict):
-                    value = p.get(attr_name, default)
-                else:
-                    return default
-                return float(value or default)
-            except Exception:
-                return default
-        
-        try:
-            if sort_by == "revenue":
-                projects.sort(key=lambda p: safe_sort_key(p, 'revenue'), reverse=True)
-                logger.info(f"Sorted by revenue: {len(projects)} projects")
-            elif sort_by == "margin":
-                projects.sort(key=lambda p: safe_sort_key(p, 'profit_margin'), reverse=True)
-                logger.info(f"Sorted by margin: {len(projects)} projects")
-            elif sort_by == "hours":
-                projects.sort(key=lambda p: safe_sort_key(p, 'total_hours'), reverse=True)
-                logger.info(f"Sorted by hours: {len(projects)} projects")
-            # Default is already sorted by profit
-        except Exception as e:
-            print(f"🔧 VERSION 1.0.16: Error sorting projects by {sort_by}: {str(e)}", flush=True)
-            logger.error(f"🔧 VERSION 1.0.16: Error sorting projects by {sort_by}: {str(e)}")
-            # Keep original order if sorting fails
+            projects = [p for p in projects if p.total_hours >= min_hours]
+            logger.debug("After min_hours filter (%sh): %d projects", min_hours, len(projects))
         
         if not projects:
             return "No projects found matching the criteria."
         
+        # Rank by specified criterion (default is already sorted by profit) - only
+        # the displayed top 10 need ordering, the summary stats use every project
+        sort_attr = _PROJECT_SORT_ATTRS.get(sort_by)
+        if sort_attr:
+            top_projects = heapq.nlargest(10, projects, key=attrgetter(sort_attr))
+            logger.debug("Ranked by %s: %d projects", sort_by, len(projects))
+        else:
+            top_projects = projects[:10]
+        
         # Format output
-        result = f"""
-💰 **PROJECT PROFITABILITY ANALYSIS**
-📅 Period: {start_date} to {end_date}
-🔍 Showing {len(projects)} projects (min {min_hours}h, sorted by {sort_by})
-
-"""
+        parts: List[str] = [_PROJECT_REPORT_HEADER.format(
+            start=start_date, end=end_date, count=len(projects),
+            min_hours=min_hours, sort_by=sort_by
+        )]
+        
+        for i, project in enumerate(top_projects, 1):
+            parts.append(_PROJECT_ROW_TEMPLATE.format(
+                i=i, name=project.project_name,
+                client_line=f"   Client: {project.client_name}" if project.client_name else "",
+                hours=project.total_hours, billable=project.billable_hours, util=project.utilization_rate,
+                cur=currency, revenue=project.revenue, profit=project.profit, margin=project.profit_margin,
+                rate=project.billable_rate, team=project.active_users, entries=project.time_entries_count
+            ))
         
-        for i, project in enumerate(projects[:10], 1):
-            result += f"""
-**{i}. {project.project_name}**
-{f"   Client: {project.client_name}" if project.client_name else ""}
-   • Hours: {project.total_hours:.1f}h total, {project.billable_hours:.1f}h billable ({project.utilization_rate:.1f}% util)
-   • Revenue: {currency} {project.revenue:,.2f}
-   • Profit: {currency} {project.profit:,.2f} ({project.profit_margin:.1f}% margin)
-   • Rate: {currency} {project.billable_rate:.2f}/hour (avg)
-   • Team: {project.active_users} members, {project.time_entries_count} entries
-"""
+        # Add summary stats
+        total_revenue, total_profit, avg_margin = _summary_totals(projects)
         
-        # Add summary stats with bulletproof error handling
-        def safe_get_value(p, attr_name, default=0):
-            try:
-                if hasattr(p, attr_name):
-                    value = getattr(p, attr_name, default)
-                elif isinstance(p, dict):
-                    value = p.get(attr_name, default)
-                else:
-                    return default
-                return float(value or default)
-            except Exception:
-                return default
-        
-        total_revenue = sum(safe_get_value(p, 'revenue') for p in projects)
-        total_profit = sum(safe_get_value(p, 'profit') for p in projects)
-        avg_margin = sum(safe_get_value(p, 'profit_margin') for p in projects) / len(projects) if projects else 0
-        
-        result += f"""
+        parts.append(f"""
 📈 **SUMMARY STATISTICS**
 • Total Revenue: {currency} {total_revenue:,.2f}
 • Total Profit: {currency} {total_profit:,.2f}
 • Average Margin: {avg_margin:.1f}%
-• Most Profitable: {projects[0].project_name} ({projects[0].profit_margin:.1f}%)
-"""
+• Most Profitable: {top_projects[0].project_name} ({top_projects[0].profit_margin:.1f}%)
+""")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Failed to get project profitability analysis: {str(e)}"
@@ -572,54 +844,50 @@ async def _get_project_profitability_analysis(workspace_id: int, start_date: str
 async def _get_team_productivity_report(workspace_id: int, start_date: str, end_date: str, include_individual_metrics: bool) -> str:
     """Get team productivity report"""
     try:
-        insights_data = await admin_server.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "users"
+        # Get insights, workspace info and user summary data concurrently
+        results = await asyncio.gather(
+            admin_server.reports_api.get_insights_profitability(
+                workspace_id, start_date, end_date, "users"
+            ),
+            admin_server.get_workspace_info(workspace_id),
+            admin_server.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "users"
+            ),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server.get_workspace_info(workspace_id)
+        _raise_first_error(results)
+        insights_data, workspace_info, user_summary = results
         currency = workspace_info.get('default_currency', 'USD')
         
-        # Get user summary data for employee profitability analysis
-        user_summary = await admin_server.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "users"
-        )
         users = admin_server.processor.process_employee_profitability(user_summary, insights_data)
         
         if not users:
             return "No team members found or data available for this period."
         
-        result = f"""
-👥 **TEAM PRODUCTIVITY REPORT**
-📅 Period: {start_date} to {end_date}
-🔍 Showing {len(users)} team members
-
-"""
+        parts: List[str] = [_TEAM_REPORT_HEADER.format(
+            start=start_date, end=end_date, count=len(users)
+        )]
         
         for i, user in enumerate(users, 1):
-            result += f"""
-**{i}. {user.username}**
-   • Total Hours: {user.total_hours:.1f}h
-   • Billable Hours: {user.billable_hours:.1f}h ({user.utilization_rate:.1f}% util)
-   • Revenue: {currency} {user.revenue:,.2f}
-   • Profit: {currency} {user.profit:,.2f} ({user.profit_margin:.1f}% margin)
-   • Rate: {currency} {user.billable_rate:.2f}/hour (avg)
-   • Projects: {user.active_projects}
-"""
+            parts.append(_TEAM_ROW_TEMPLATE.format(
+                i=i, name=user.username, hours=user.total_hours,
+                billable=user.billable_hours, util=user.utilization_rate,
+                cur=currency, revenue=user.revenue, profit=user.profit, margin=user.profit_margin,
+                rate=user.billable_rate, projects=user.active_projects
+            ))
         
         # Add summary stats
-        total_revenue = sum(u.revenue for u in users)
-        total_profit = sum(u.profit for u in users)
-        avg_margin = sum(u.profit_margin for u in users) / len(users)
+        total_revenue, total_profit, avg_margin = _summary_totals(users)
         
-        result += f"""
+        parts.append(f"""
 📈 **SUMMARY STATISTICS**
 • Total Revenue: {currency} {total_revenue:,.2f}
 • Total Profit: {currency} {total_profit:,.2f}
 • Average Margin: {avg_margin:.1f}%
 • Most Productive: {users[0].username} ({users[0].utilization_rate:.1f}% util)
-"""
+""")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Failed to get team productivity report: {str(e)}"
@@ -627,17 +895,21 @@ async def _get_team_productivity_report(workspace_id: int, start_date: str, end_
 async def _get_client_profitability_analysis(workspace_id: int, start_date: str, end_date: str, min_revenue: float) -> str:
     """Get client-level profitability and revenue analysis"""
     try:
-        insights_data = await admin_server.reports_api.get_insights_profitability(
-            workspace_id, start_date, end_date, "clients"
+        # Get insights, workspace info and client summary data concurrently
+        results = await asyncio.gather(
+            admin_server.reports_api.get_insights_profitability(
+                workspace_id, start_date, end_date, "clients"
+            ),
+            admin_server.get_workspace_info(workspace_id),
+            admin_server.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "clients"
+            ),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server.get_workspace_info(workspace_id)
+        _raise_first_error(results)
+        insights_data, workspace_info, client_summary = results
         currency = workspace_info.get('default_currency', 'USD')
         
-        # Get client summary data for client profitability analysis
-        client_summary = await admin_server.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "clients"
-        )
         clients = admin_server.processor.process_client_profitability(client_summary, insights_data, currency)
         
         # Filter by minimum revenue
@@ -647,35 +919,28 @@ async def _get_client_profitability_analysis(workspace_id: int, start_date: str,
         if not clients:
             return "No clients found matching the criteria."
         
-        result = f"""
-💰 **CLIENT PROFITABILITY ANALYSIS**
-📅 Period: {start_date} to {end_date}
-🔍 Showing {len(clients)} clients
-
-"""
+        parts: List[str] = [_CLIENT_REPORT_HEADER.format(
+            start=start_date, end=end_date, count=len(clients)
+        )]
         
         for i, client in enumerate(clients[:10], 1):
-            result += f"""
-**{i}. {client.client_name}**
-   • Total Revenue: {currency} {client.revenue:,.2f}
-   • Total Profit: {currency} {client.profit:,.2f} ({client.profit_margin:.1f}% margin)
-   • Projects: {client.active_projects}
-"""
+            parts.append(_CLIENT_ROW_TEMPLATE.format(
+                i=i, name=client.client_name, cur=currency, revenue=client.revenue,
+                profit=client.profit, margin=client.profit_margin, projects=client.active_projects
+            ))
         
         # Add summary stats
-        total_revenue = sum(c.revenue for c in clients)
-        total_profit = sum(c.profit for c in clients)
-        avg_margin = sum(c.profit_margin for c in clients) / len(clients)
+        total_revenue, total_profit, avg_margin = _summary_totals(clients)
         
-        result += f"""
+        parts.append(f"""
 📈 **SUMMARY STATISTICS**
 • Total Revenue: {currency} {total_revenue:,.2f}
 • Total Profit: {currency} {total_profit:,.2f}
 • Average Margin: {avg_margin:.1f}%
 • Most Profitable: {clients[0].client_name} ({clients[0].profit_margin:.1f}% margin)
-"""
+""")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Failed to get client profitability analysis: {str(e)}"
@@ -683,37 +948,28 @@ async def _get_client_profitability_analysis(workspace_id: int, start_date: str,
 async def _get_financial_summary(workspace_id: int, start_date: str, end_date: str, compare_previous: bool) -> str:
     """Get high-level financial summary"""
     try:
-        summary_data = await admin_server.reports_api.get_summary_report(
-            workspace_id, start_date, end_date, "projects"
+        # Get summary data and workspace info concurrently
+        results = await asyncio.gather(
+            admin_server.reports_api.get_summary_report(
+                workspace_id, start_date, end_date, "projects"
+            ),
+            admin_server.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server.get_workspace_info(workspace_id)
+        _raise_first_error(results)
+        summary_data, workspace_info = results
         currency = workspace_info.get('default_currency', 'USD')
         
         financial_summary = admin_server.processor.process_financial_summary(summary_data, currency)
         
-        result = f"""
-💰 **FINANCIAL SUMMARY**
-📅 Period: {start_date} to {end_date}
-🔍 Showing financial summary for {workspace_info.get('name', 'this workspace')}
-
-"""
-        
-        result += f"""
-📊 **FINANCIAL SUMMARY**
-• Total Hours: {financial_summary['total_hours']:,.1f}h
-• Billable Hours: {financial_summary['billable_hours']:,.1f}h
-• Non-Billable Hours: {financial_summary['non_billable_hours']:,.1f}h
-• Total Revenue: {currency} {financial_summary['total_revenue']:,.2f}
-• Utilization Rate: {financial_summary['utilization_rate']:.1f}%
-"""
+        result = _FINANCIAL_SUMMARY_TEMPLATE.format_map(dict(
+            asdict(financial_summary),
+            currency=currency, start=start_date, end=end_date,
+            workspace_name=workspace_info.get('name', 'this workspace')
+        ))
         
         if compare_previous:
-            result += f"""
-📈 **COMPARISON WITH PREVIOUS PERIOD**
-• This feature is currently being enhanced to provide period-over-period comparisons.
-• Current focus is on current period financial metrics.
-"""
+            result += _FINANCIAL_COMPARISON_TEXT
         
         return result
         
@@ -723,53 +979,30 @@ async def _get_financial_summary(workspace_id: int, start_date: str, end_date: s
 async def _get_productivity_insights(workspace_id: int, start_date: str, end_date: str, include_detailed_analysis: bool) -> str:
     """Get advanced productivity insights and time tracking patterns"""
     try:
-        # Get detailed entries from Reports API v3 for accurate profitability calculations
-        detailed_entries = await admin_server.reports_api.get_detailed_report_v3(
-            workspace_id, start_date, end_date, hide_amounts=False
+        # Get detailed entries from Reports API v3 for accurate profitability
+        # calculations, and workspace info, concurrently
+        results = await asyncio.gather(
+            admin_server.get_detailed_report_v3(
+                workspace_id, start_date, end_date, hide_amounts=False
+            ),
+            admin_server.get_workspace_info(workspace_id),
+            return_exceptions=True
         )
-        
-        workspace_info = await admin_server.get_workspace_info(workspace_id)
-        # Handle both dict and dataclass workspace info
-        if hasattr(workspace_info, 'default_currency'):
-            currency = workspace_info.default_currency
-        else:
-            currency = workspace_info.get('default_currency', 'USD')
+        _raise_first_error(results)
+        detailed_entries, workspace_info = results
+        currency = workspace_info.get('default_currency', 'USD')
         
         # Use the new profitability processing with Reports API v3 data
         profitability_data = admin_server.processor.process_profitability_from_v3_data(detailed_entries, currency)
         
-        # Handle workspace name
-        if hasattr(workspace_info, 'name'):
-            workspace_name = workspace_info.name
-        else:
-            workspace_name = workspace_info.get('name', 'this workspace')
-        
-        result = f"""
-💡 **PRODUCTIVITY INSIGHTS**
-📅 Period: {start_date} to {end_date}
-🔍 Showing productivity insights for {workspace_name}
-
-"""
-        
-        result += f"""
-📊 **TIME TRACKING PATTERNS**
-• Total Hours: {profitability_data['total_hours']:,.1f}h
-• Average Hourly Rate: {currency} {profitability_data['average_hourly_rate']:.2f}
-
-📊 **PROFITABILITY METRICS**
-• Total Revenue: {currency} {profitability_data['total_revenue']:,.2f}
-• Total Labor Cost: {currency} {profitability_data['total_labor_cost']:,.2f}
-• Total Profit: {currency} {profitability_data['total_profit']:,.2f}
-• Profit Margin: {profitability_data['profit_margin']:.1f}%
-• Labor Cost %: {profitability_data['labor_cost_percentage']*100:.0f}% of billing rate
-"""
+        result = _INSIGHTS_TEMPLATE.format_map(dict(
+            profitability_data,
+            currency=currency, start=start_date, end=end_date,
+            workspace_name=workspace_info.get('name', 'this workspace')
+        ))
         
         if include_detailed_analysis:
-            result += f"""
-📊 **DETAILED ANALYSIS**
-• This feature is currently being enhanced to provide more detailed insights.
-• Current focus is on high-level productivity metrics and utilization rates.
-"""
+            result += _INSIGHTS_DETAIL_TEXT
         
         return result
         
@@ -796,5 +1029,8 @@ async def main():
         else:
             logger.warning("TOGGL_API_TOKEN not set - API features will be limited")
         
-        # Run the server
-        await server.run(read_stream, write_stream, init_options)
\ No newline at end of file
+        # Run the server, closing the shared HTTP clients on shutdown
+        try:
+            await server.run(read_stream, write_stream, init_options)
+        finally:
+            await close_apis()
\ No newline at end of file
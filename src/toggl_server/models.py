@@ -1,13 +1,19 @@
 """
 Extended data models for Toggl MCP server with admin-level reporting
 """
+import heapq
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
+
+_get_profit = attrgetter('profit')
+_get_utilization_rate = attrgetter('utilization_rate')
+_get_profit_margin = attrgetter('profit_margin')
 
 # Original models (keep existing ones)
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TogglWorkspace:
     id: int
     name: str
@@ -28,7 +34,7 @@ class TogglWorkspace:
     rounding: int = 0
     rounding_minutes: int = 0
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TogglTimeEntry:
     id: int
     description: str
@@ -51,7 +57,7 @@ class TogglTimeEntry:
     tid: Optional[int] = None
 
 # New admin-level models
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectProfitability:
     """Project profitability analysis data"""
     project_id: int
@@ -68,22 +74,31 @@ class ProjectProfitability:
     currency: str
     active_users: int
     time_entries_count: int
+    _utilization_rate: float = field(init=False, repr=False, compare=False)
+    _hourly_profit: Decimal = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Derived metrics are read repeatedly while rendering reports, so compute them once.
+        # Frozen, so they are set through object.__setattr__
+        set_field = object.__setattr__
+        if self.total_hours == 0:
+            set_field(self, '_utilization_rate', 0.0)
+            set_field(self, '_hourly_profit', Decimal('0'))
+        else:
+            set_field(self, '_utilization_rate', (self.billable_hours / self.total_hours) * 100)
+            set_field(self, '_hourly_profit', self.profit / Decimal(str(self.total_hours)))
     
     @property
     def utilization_rate(self) -> float:
         """Calculate billable utilization rate"""
-        if self.total_hours == 0:
-            return 0.0
-        return (self.billable_hours / self.total_hours) * 100
+        return self._utilization_rate
     
     @property
     def hourly_profit(self) -> Decimal:
         """Calculate profit per hour"""
-        if self.total_hours == 0:
-            return Decimal('0')
-        return self.profit / Decimal(str(self.total_hours))
+        return self._hourly_profit
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmployeeProfitability:
     """Employee productivity and profitability metrics"""
     user_id: int
@@ -97,29 +112,44 @@ class EmployeeProfitability:
     revenue_generated: Decimal
     projects_worked: int
     time_entries_count: int
+    _utilization_rate: float = field(init=False, repr=False, compare=False)
+    _productivity_score: float = field(init=False, repr=False, compare=False)
+    _average_hours_per_day: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Derived metrics are read repeatedly while ranking and rendering, so compute them once.
+        # Frozen, so they are set through object.__setattr__
+        set_field = object.__setattr__
+        if self.total_hours == 0:
+            utilization_rate = 0.0
+        else:
+            utilization_rate = (self.billable_hours / self.total_hours) * 100
+        set_field(self, '_utilization_rate', utilization_rate)
+        
+        base_score = utilization_rate
+        if self.total_hours > 160:  # Full-time equivalent per month
+            base_score *= 1.1  # Bonus for high volume
+        set_field(self, '_productivity_score', min(base_score, 100.0))
+        
+        # This would need date range context to be accurate
+        set_field(self, '_average_hours_per_day', self.total_hours / 30)  # Rough monthly estimate
     
     @property
     def utilization_rate(self) -> float:
         """Calculate billable utilization rate"""
-        if self.total_hours == 0:
-            return 0.0
-        return (self.billable_hours / self.total_hours) * 100
+        return self._utilization_rate
     
     @property
     def average_hours_per_day(self) -> float:
         """Calculate average hours per working day (assuming 5 day work week)"""
-        # This would need date range context to be accurate
-        return self.total_hours / 30  # Rough monthly estimate
+        return self._average_hours_per_day
     
     @property
     def productivity_score(self) -> float:
         """Simple productivity score based on utilization and hours"""
-        base_score = self.utilization_rate
-        if self.total_hours > 160:  # Full-time equivalent per month
-            base_score *= 1.1  # Bonus for high volume
-        return min(base_score, 100.0)
+        return self._productivity_score
 
-@dataclass  
+@dataclass(slots=True)
 class ClientProfitability:
     """Client-level profitability analysis"""
     client_id: Optional[int]
@@ -134,7 +164,7 @@ class ClientProfitability:
     active_users: int
     currency: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrganizationSummary:
     """High-level organization metrics and KPIs"""
     workspace_id: int
@@ -159,36 +189,46 @@ class OrganizationSummary:
     active_users: int
     total_time_entries: int
     
+    # Calculated in __post_init__
+    _overall_utilization_rate: float = field(init=False, repr=False, compare=False)
+    _overall_profit_margin: float = field(init=False, repr=False, compare=False)
+    _average_project_size: float = field(init=False, repr=False, compare=False)
+    _average_user_hours: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so the derived metrics are set through object.__setattr__
+        set_field = object.__setattr__
+        set_field(self, '_overall_utilization_rate',
+                  (self.billable_hours / self.total_hours) * 100 if self.total_hours != 0 else 0.0)
+        set_field(self, '_overall_profit_margin',
+                  float((self.total_profit / self.total_revenue) * 100) if self.total_revenue != 0 else 0.0)
+        set_field(self, '_average_project_size',
+                  self.total_hours / self.active_projects if self.active_projects != 0 else 0.0)
+        set_field(self, '_average_user_hours',
+                  self.total_hours / self.active_users if self.active_users != 0 else 0.0)
+    
     # Calculated properties
     @property
     def overall_utilization_rate(self) -> float:
         """Organization-wide billable utilization rate"""
-        if self.total_hours == 0:
-            return 0.0
-        return (self.billable_hours / self.total_hours) * 100
+        return self._overall_utilization_rate
     
     @property
     def overall_profit_margin(self) -> float:
         """Organization-wide profit margin percentage"""
-        if self.total_revenue == 0:
-            return 0.0
-        return float((self.total_profit / self.total_revenue) * 100)
+        return self._overall_profit_margin
     
     @property
     def average_project_size(self) -> float:
         """Average hours per active project"""
-        if self.active_projects == 0:
-            return 0.0
-        return self.total_hours / self.active_projects
+        return self._average_project_size
     
     @property
     def average_user_hours(self) -> float:
         """Average hours per active user"""
-        if self.active_users == 0:
-            return 0.0
-        return self.total_hours / self.active_users
+        return self._average_user_hours
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TeamProductivityMetrics:
     """Team-wide productivity analysis"""
     workspace_id: int
@@ -206,20 +246,48 @@ class TeamProductivityMetrics:
     top_performers: List[EmployeeProfitability]
     underperformers: List[EmployeeProfitability]
     team_average_rate: Decimal
+    _productivity_trend: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def productivity_trend(self) -> str:
-        """Simple productivity trend indicator"""
+    def __post_init__(self):
+        # Frozen, so the trend label is set through object.__setattr__
         if self.overall_efficiency >= 80:
-            return "Excellent"
+            trend = "Excellent"
         elif self.overall_efficiency >= 60:
-            return "Good"  
+            trend = "Good"
         elif self.overall_efficiency >= 40:
-            return "Fair"
+            trend = "Fair"
         else:
-            return "Needs Improvement"
+            trend = "Needs Improvement"
+        object.__setattr__(self, '_productivity_trend', trend)
+    
+    @property
+    def productivity_trend(self) -> str:
+        """Simple productivity trend indicator"""
+        return self._productivity_trend
+
+@dataclass(frozen=True, slots=True)
+class ProductivitySummary:
+    """Aggregate productivity metrics for a reporting period"""
+    total_hours: float
+    billable_hours: float
+    non_billable_hours: float
+    total_revenue: float
+    utilization_rate: float  # billable vs total hours
+    efficiency_rate: float
+    avg_hourly_rate: float
+    currency: str
+
+@dataclass(frozen=True, slots=True)
+class FinancialSummary:
+    """Aggregate financial metrics for a reporting period"""
+    total_hours: float
+    billable_hours: float
+    non_billable_hours: float
+    total_revenue: float
+    utilization_rate: float  # billable vs total hours
+    currency: str
 
-@dataclass
+@dataclass(slots=True)
 class AdminReportData:
     """Complete admin dashboard data structure"""
     organization_summary: OrganizationSummary
@@ -232,28 +300,17 @@ class AdminReportData:
     
     def get_top_projects_by_profit(self, limit: int = 5) -> List[ProjectProfitability]:
         """Get top N most profitable projects"""
-        return sorted(
-            self.project_profitability, 
-            key=lambda p: p.profit, 
-            reverse=True
-        )[:limit]
+        return heapq.nlargest(limit, self.project_profitability, key=_get_profit)
     
     def get_top_employees_by_utilization(self, limit: int = 5) -> List[EmployeeProfitability]:
         """Get top N employees by utilization rate"""
-        return sorted(
-            self.employee_profitability,
-            key=lambda e: e.utilization_rate,
-            reverse=True
-        )[:limit]
+        return heapq.nlargest(limit, self.employee_profitability, key=_get_utilization_rate)
     
     def get_underperforming_projects(self, profit_threshold: float = 20.0) -> List[ProjectProfitability]:
         """Get projects with profit margin below threshold"""
-        return [
-            p for p in self.project_profitability 
-            if p.profit_margin < profit_threshold
-        ]
+        return [p for p in self.project_profitability if _get_profit_margin(p) < profit_threshold]
 
-@dataclass
+@dataclass(slots=True)
 class TimeTrackingInsights:
     """Advanced time tracking insights and patterns"""
     workspace_id: int
@@ -273,7 +330,7 @@ class TimeTrackingInsights:
     project_time_distribution: Dict[str, float]  # project_name: percentage
     most_productive_projects: List[str]
     
-@dataclass
+@dataclass(slots=True)
 class BillingAnalysis:
     """Billing and revenue analysis"""
     workspace_id: int
@@ -2,64 +2,173 @@
 Toggl Reports API v3 Client for admin-level reporting functionality
 """
 import aiohttp
-import ssl
-import certifi
-import base64
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, date
+import math
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, date, timezone
 import logging
 
+from toggl_server.http_client import TogglHTTPClient
+from toggl_server.utils import SingleFlight, json_loads
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional speedup for large detailed reports
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+MAX_RATE_LIMIT_ATTEMPTS = 5
+PAGE_REQUEST_INTERVAL = 1.1  # Slightly over the 1 request/second limit for safety
+
+# GET responses for closed date ranges are historical and change rarely;
+# ranges that reach today are still filling up, so they expire sooner
+RESPONSE_CACHE_TTL = 300.0
+CURRENT_RESPONSE_CACHE_TTL = 60.0
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited request
+    
+    Args:
+        retry_after: Retry-After header value (delta seconds or HTTP-date), if any
+        attempt: Zero-based attempt number, used for the exponential fallback
+    """
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            pass
+    return min(2 ** attempt, 60) + random.uniform(0, 1)
+
+def _response_cache_ttl(params: Dict[str, Any]) -> float:
+    """Cache lifetime for a GET response, shorter when its date range reaches today"""
+    until = params.get("until")
+    if until and str(until) >= date.today().isoformat():
+        return CURRENT_RESPONSE_CACHE_TTL
+    return RESPONSE_CACHE_TTL
+
+def _cache_validators(headers) -> Optional[Dict[str, str]]:
+    """Conditional request headers for revalidating a cached response, if the server sent any"""
+    validators = {}
+    etag = headers.get("ETag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    return validators or None
+
+class _RequestPacer:
+    """Spaces request starts `interval` seconds apart without waiting for earlier responses"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+    
+    async def wait(self):
+        """Reserve the next free slot and sleep until it arrives"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
 class TogglReportsAPI:
     """Client for Toggl Reports API v3 - provides admin-level analytics and reporting"""
     
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, http: Optional[TogglHTTPClient] = None):
         self.api_token = api_token
         self.base_url = "https://api.track.toggl.com/reports/api/v2"
         self.reports_v3_url = "https://api.track.toggl.com/reports/api/v3"
         self.api_v9_url = "https://api.track.toggl.com/api/v9"
-        self.auth_header = self._get_auth_header()
-        self.session = None
+        # Workspace-independent endpoints are fixed, so build their URLs once
+        self.summary_url = f"{self.base_url}/summary"
+        self.detailed_url = f"{self.base_url}/detailed"
+        self.weekly_url = f"{self.base_url}/weekly"
+        # Sent per request, since the session may be shared with other clients
+        self.auth = aiohttp.BasicAuth(self.api_token, "api_token")
+        # Share the caller's HTTP session (and its connection pool) when one is given
+        self.http = http or TogglHTTPClient()
+        self._owns_http = http is None
+        # (url, sorted params) -> (fetched_at, validators, response), kept in LRU order
+        self._response_cache: Dict[tuple, tuple] = {}
+        self._inflight = SingleFlight()  # requests shared by concurrent callers
+    
+    async def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Make authenticated GET request through the in-memory response cache"""
+        key = (url, tuple(sorted(params.items())))
+        cached = self._response_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _response_cache_ttl(params):
+            # Re-insert to mark the entry as most recently used
+            self._response_cache[key] = self._response_cache.pop(key)
+            return cached[2]
         
-        # Create SSL context with proper certificate verification
-        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self.ssl_context.check_hostname = True
-        self.ssl_context.verify_mode = ssl.CERT_REQUIRED
+        async def fetch() -> Dict[str, Any]:
+            # Expired entries are revalidated with their ETag/Last-Modified validators
+            body, validators = await self._get_json(url, params, cached[1] if cached else None)
+            if body is None:  # Not modified - keep serving the cached response
+                body = cached[2]
+            self._response_cache.pop(key, None)
+            self._response_cache[key] = (time.monotonic(), validators, body)
+            if len(self._response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                del self._response_cache[next(iter(self._response_cache))]
+            return body
         
-    def _get_auth_header(self) -> str:
-        """Generate Basic Auth header for API requests"""
-        credentials = f"{self.api_token}:api_token"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {encoded_credentials}"
+        # Single-flight: concurrent callers for the same key share one upstream request
+        return await self._inflight.run(key, fetch)
     
-    async def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make authenticated request with rate limiting and error handling"""
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json"
-        }
+    async def _get_json(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        conditional_headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Any], Optional[Dict[str, str]]]:
+        """
+        Make authenticated GET request with rate limiting and error handling
         
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            conditional_headers: If-None-Match/If-Modified-Since headers from a cached response
+            
+        Returns:
+            Tuple of (parsed JSON or None when the server answered 304 Not Modified, cache validators)
+        """
         try:
-            if not self.session:
-                connector = aiohttp.TCPConnector(ssl=self.ssl_context)
-                self.session = aiohttp.ClientSession(connector=connector)
-                
-            async with self.session.get(url, params=params, headers=headers) as response:
-                if response.status == 429:  # Rate limited
-                    logger.warning("Rate limited, waiting 60 seconds...")
-                    await asyncio.sleep(60)
-                    return await self._make_request(url, params)
-                
-                if response.status == 402:  # Payment required
-                    raise Exception("Feature requires Premium/Enterprise plan")
+            session = await self.http.get_session()
+            for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+                async with session.get(url, params=params, headers=conditional_headers, auth=self.auth) as response:
+                    if response.status == 429:  # Rate limited
+                        retry_after = response.headers.get("Retry-After")
+                    elif response.status == 304 and conditional_headers:  # Not modified
+                        return None, conditional_headers
+                    else:
+                        if response.status == 402:  # Payment required
+                            raise Exception("Feature requires Premium/Enterprise plan")
+                        
+                        if response.status == 403:  # Forbidden
+                            raise Exception("Insufficient permissions - admin access required")
+                        
+                        response.raise_for_status()
+                        return await response.json(loads=json_loads), _cache_validators(response.headers)
                 
-                if response.status == 403:  # Forbidden
-                    raise Exception("Insufficient permissions - admin access required")
-                
-                response.raise_for_status()
-                return await response.json()
+                if attempt == MAX_RATE_LIMIT_ATTEMPTS - 1:
+                    break
+                # Sleep outside the response context so the connection goes back to the pool
+                delay = _retry_delay(retry_after, attempt)
+                logger.warning(f"Rate limited, retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+            
+            raise Exception(f"Reports API rate limit persisted after {MAX_RATE_LIMIT_ATTEMPTS} attempts")
                 
         except aiohttp.ClientError as e:
             logger.error(f"API request failed: {e}")
@@ -85,7 +194,6 @@ class TogglReportsAPI:
             sub_grouping: Optional secondary grouping
             include_time_entry_ids: Include time entry IDs in response
         """
-        url = f"{self.base_url}/summary"
         params = {
             "workspace_id": workspace_id,
             "since": start_date,
@@ -98,7 +206,7 @@ class TogglReportsAPI:
         if include_time_entry_ids:
             params["include_time_entry_ids"] = "true"
             
-        return await self._make_request(url, params)
+        return await self._make_request(self.summary_url, params)
     
     async def get_insights_profitability(
         self, 
@@ -117,7 +225,6 @@ class TogglReportsAPI:
             grouping: Group by 'projects' or 'users'
         """
         # Use the summary endpoint since v2 API doesn't have separate profitability endpoint
-        url = f"{self.base_url}/summary"
         params = {
             "workspace_id": workspace_id,
             "since": start_date,
@@ -125,7 +232,7 @@ class TogglReportsAPI:
             "grouping": grouping
         }
         
-        return await self._make_request(url, params)
+        return await self._make_request(self.summary_url, params)
     
     async def get_detailed_report_v3(
         self, 
@@ -146,36 +253,54 @@ class TogglReportsAPI:
         url = f"{self.reports_v3_url}/workspace/{workspace_id}/search/time_entries"
         
         # This is a POST request with JSON body
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json"
-        }
-        
         body = {
             "start_date": start_date,
             "end_date": end_date,
             "hide_amounts": hide_amounts
         }
         
+        # Several reports search the same range at once; they share one upstream request
+        key = ("POST", url, start_date, end_date, hide_amounts)
+        return await self._inflight.run(key, lambda: self._post_search(url, body))
+    
+    async def _post_search(self, url: str, body: Dict[str, Any]) -> Any:
+        """
+        Make authenticated Reports API v3 search POST with rate limiting and error handling
+        
+        Args:
+            url: Search endpoint URL
+            body: JSON request body
+            
+        Returns:
+            Parsed JSON response (the list of time entries)
+        """
         try:
-            if not self.session:
-                connector = aiohttp.TCPConnector(ssl=self.ssl_context)
-                self.session = aiohttp.ClientSession(connector=connector)
-                
-            async with self.session.post(url, json=body, headers=headers) as response:
-                if response.status == 429:  # Rate limited
-                    logger.warning("Rate limited, waiting 60 seconds...")
-                    await asyncio.sleep(60)
-                    return await self.get_detailed_report_v3(workspace_id, start_date, end_date, hide_amounts)
-                
-                if response.status == 402:  # Payment required
-                    raise Exception("Feature requires Premium/Enterprise plan")
-                
-                if response.status == 403:  # Forbidden
-                    raise Exception("Insufficient permissions - admin access required")
+            session = await self.http.get_session()
+            for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+                async with session.post(url, json=body, auth=self.auth) as response:
+                    if response.status == 429:  # Rate limited
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        if response.status == 402:  # Payment required
+                            raise Exception("Feature requires Premium/Enterprise plan")
+                        
+                        if response.status == 403:  # Forbidden
+                            raise Exception("Insufficient permissions - admin access required")
+                        
+                        response.raise_for_status()
+                        if ijson is not None:
+                            # Parse the top-level entry array as it arrives instead of buffering the body
+                            return [entry async for entry in ijson.items(response.content, "item", use_float=True)]
+                        return await response.json(loads=json_loads)
                 
-                response.raise_for_status()
-                return await response.json()
+                if attempt == MAX_RATE_LIMIT_ATTEMPTS - 1:
+                    break
+                # Sleep outside the response context so the connection goes back to the pool
+                delay = _retry_delay(retry_after, attempt)
+                logger.warning(f"Rate limited, retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+            
+            raise Exception(f"Reports API v3 rate limit persisted after {MAX_RATE_LIMIT_ATTEMPTS} attempts")
                 
         except aiohttp.ClientError as e:
             logger.error(f"API request failed: {e}")
@@ -223,7 +348,6 @@ class TogglReportsAPI:
             first_row_number: Row number for pagination
             page_size: Number of entries per page (max 50)
         """
-        url = f"{self.base_url}/detailed"
         params = {
             "workspace_id": workspace_id,
             "since": start_date,
@@ -234,7 +358,7 @@ class TogglReportsAPI:
         if first_row_number:
             params["first_row_number"] = first_row_number
             
-        return await self._make_request(url, params)
+        return await self._make_request(self.detailed_url, params)
     
     async def get_weekly_report(
         self,
@@ -252,7 +376,6 @@ class TogglReportsAPI:
             end_date: End date in YYYY-MM-DD format
             grouping: Group by 'projects', 'users', 'clients'
         """
-        url = f"{self.base_url}/weekly"
         params = {
             "workspace_id": workspace_id,
             "since": start_date,
@@ -260,7 +383,7 @@ class TogglReportsAPI:
             "grouping": grouping
         }
         
-        return await self._make_request(url, params)
+        return await self._make_request(self.weekly_url, params)
     
     async def get_all_detailed_entries(
         self,
@@ -279,31 +402,44 @@ class TogglReportsAPI:
         Returns:
             List of all time entries across all pages
         """
-        all_entries = []
-        next_row = None
+        # Every page request goes through the pacer to respect rate limits
+        pacer = _RequestPacer(PAGE_REQUEST_INTERVAL)
+        await pacer.wait()
+        response = await self.get_detailed_report(workspace_id, start_date, end_date)
+        all_entries = list(response.get("data", []))
+        
+        total_count = response.get("total_count")
+        per_page = response.get("per_page")
+        if total_count and per_page:
+            # Page count is known, so the remaining round trips can overlap the pacing delays
+            async def fetch_page(first_row_number: int) -> Dict[str, Any]:
+                await pacer.wait()
+                return await self.get_detailed_report(
+                    workspace_id, start_date, end_date, first_row_number
+                )
+            
+            pages = await asyncio.gather(*[
+                fetch_page(page * per_page + 1)
+                for page in range(1, math.ceil(total_count / per_page))
+            ])
+            for page in pages:
+                all_entries.extend(page.get("data", []))
+            return all_entries
         
-        while True:
+        # No totals reported - follow next_row_number one page at a time
+        while "next_row_number" in response:
+            await pacer.wait()
             response = await self.get_detailed_report(
-                workspace_id, start_date, end_date, next_row
+                workspace_id, start_date, end_date, response["next_row_number"]
             )
-            
-            if "data" in response:
-                all_entries.extend(response["data"])
-            
-            # Check if there are more pages
-            if "next_row_number" in response:
-                next_row = response["next_row_number"]
-                # Add delay to respect rate limits
-                await asyncio.sleep(1.1)  # Slightly over 1 second for safety
-            else:
-                break
+            all_entries.extend(response.get("data", []))
                 
         return all_entries
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self.session:
-            await self.session.close()
+        """Close the aiohttp session, unless it is shared with other clients"""
+        if self._owns_http:
+            await self.http.close()
     
     async def __aenter__(self):
         return self
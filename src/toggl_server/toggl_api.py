@@ -6,106 +6,148 @@ import os
 import asyncio
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-import httpx
+import aiohttp
+from toggl_server.http_client import TogglHTTPClient
 from toggl_server.models import TogglTimeEntry as TimeEntry, TogglWorkspace as Workspace
-from toggl_server.utils import parse_time_entry_response
+from toggl_server.utils import json_loads, parse_time_entry_response
+
+# Model fields accepted from API responses; anything else would break __init__
+_TIME_ENTRY_FIELDS = frozenset((
+    'id', 'description', 'start', 'duration', 'project_id', 'project_name',
+    'task_id', 'workspace_id', 'billable', 'tags', 'stop', 'created_with',
+    'duronly', 'at', 'uid', 'wid', 'pid', 'tid'
+))
+_WORKSPACE_FIELDS = frozenset((
+    'id', 'name', 'premium', 'admin', 'organization_id', 'business_ws',
+    'role', 'suspended_at', 'server_deleted_at', 'rate_last_updated',
+    'default_hourly_rate', 'default_currency', 'only_admins_may_create_projects',
+    'only_admins_see_billable_rates', 'only_admins_see_team_dashboard',
+    'projects_billable_by_default', 'rounding', 'rounding_minutes'
+))
+
+def _build_time_entry(data: Dict[str, Any]) -> TimeEntry:
+    """Normalize a time entry response and build the model from its known fields."""
+    entry_data = parse_time_entry_response(data)
+    return TimeEntry(**{k: entry_data[k] for k in _TIME_ENTRY_FIELDS.intersection(entry_data)})
 
 class TogglAPIError(Exception):
     """Custom exception for Toggl API errors."""
     pass
 
+class TogglAuthError(TogglAPIError):
+    """The API token was rejected."""
+    pass
+
 class TogglAPI:
     """Client for interacting with the Toggl Track API."""
     
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(self, api_token: Optional[str] = None, http: Optional[TogglHTTPClient] = None):
         self.api_token = api_token or os.getenv("TOGGL_API_TOKEN")
         if not self.api_token:
             raise TogglAPIError("TOGGL_API_TOKEN environment variable is required")
         
         self.base_url = "https://api.track.toggl.com/api/v9"
-        self.auth = (self.api_token, "api_token")
+        self.auth = aiohttp.BasicAuth(self.api_token, "api_token")
+        self.headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Lazy Toggl MCP Server/0.1.0"
+        }
+        self.timeout = aiohttp.ClientTimeout(total=30.0)
         
-        # Create HTTP client with proper configuration
-        self.client = httpx.AsyncClient(
-            auth=self.auth,
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": "Lazy Toggl MCP Server/0.1.0"
-            },
-            timeout=30.0
-        )
+        # Share the caller's HTTP session (and its connection pool) when one is given
+        self.http = http or TogglHTTPClient()
+        self._owns_http = http is None
+        self._etag_cache: Dict[str, tuple] = {}  # url -> (etag, parsed body) for conditional GETs
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        await self.close()
+    
+    async def close(self):
+        """Close the underlying HTTP session, unless it is shared with other clients."""
+        if self._owns_http:
+            await self.http.close()
     
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make an authenticated request to the Toggl API."""
+    async def _request(self, method: str, endpoint: str, conditional: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Make an authenticated request to the Toggl API.
+        
+        Args:
+            method: HTTP method
+            endpoint: Path below the API base URL
+            conditional: Revalidate the last response for this URL with its ETag, so an
+                unchanged resource costs a bodyless 304. Only for bodies callers never mutate.
+            **kwargs: Passed through to the aiohttp request
+        """
         url = f"{self.base_url}{endpoint}"
+        cached = self._etag_cache.get(url) if conditional else None
+        headers = {**self.headers, "If-None-Match": cached[0]} if cached else self.headers
         
         try:
-            response = await self.client.request(method, url, **kwargs)
+            session = await self.http.get_session()
+            async with session.request(
+                method, url, auth=self.auth, headers=headers, timeout=self.timeout, **kwargs
+            ) as response:
+                status = response.status
+                content = await response.read()
+                etag = response.headers.get("ETag")
+            
+            # Handle unchanged resources
+            if status == 304 and cached:
+                return cached[1]
             
             # Handle rate limiting
-            if response.status_code == 429:
+            if status == 429:
                 raise TogglAPIError("Rate limit exceeded. Please wait before making more requests.")
             
             # Handle authentication errors
-            if response.status_code == 403:
-                raise TogglAPIError("Authentication failed. Please check your API token.")
+            if status in (401, 403):
+                raise TogglAuthError("Authentication failed. Please check your API token.")
             
             # Handle not found
-            if response.status_code == 404:
+            if status == 404:
                 raise TogglAPIError("Resource not found.")
             
             # Handle other client errors
-            if response.status_code >= 400:
+            if status >= 400:
                 try:
-                    error_data = response.json()
-                    error_msg = error_data.get("message", f"HTTP {response.status_code}")
+                    error_data = json_loads(content)
+                    error_msg = error_data.get("message", f"HTTP {status}")
                 except:
-                    error_msg = f"HTTP {response.status_code}"
+                    error_msg = f"HTTP {status}"
                 raise TogglAPIError(f"API error: {error_msg}")
             
-            response.raise_for_status()
-            
             # Handle empty responses
-            if not response.content:
+            if not content:
                 return {}
             
-            return response.json()
+            data = json_loads(content)
+            if conditional and etag:
+                self._etag_cache[url] = (etag, data)
+            return data
             
-        except httpx.RequestError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise TogglAPIError(f"Network error: {str(e)}")
-        except Exception as e:
-            raise TogglAPIError(f"Unexpected error: {str(e)}")
     
     async def get_user_info(self) -> Dict[str, Any]:
         """Get current user information."""
-        return await self._request("GET", "/me")
+        return await self._request("GET", "/me", conditional=True)
     
     async def get_workspaces(self) -> List[Workspace]:
         """Get all workspaces for the current user."""
-        data = await self._request("GET", "/workspaces")
+        data = await self._request("GET", "/workspaces", conditional=True)
         workspaces = []
         for workspace in data:
             # Filter out unknown fields to avoid __init__ errors
-            known_fields = {
-                'id', 'name', 'premium', 'admin', 'organization_id', 'business_ws',
-                'role', 'suspended_at', 'server_deleted_at', 'rate_last_updated',
-                'default_hourly_rate', 'default_currency', 'only_admins_may_create_projects',
-                'only_admins_see_billable_rates', 'only_admins_see_team_dashboard',
-                'projects_billable_by_default', 'rounding', 'rounding_minutes'
-            }
-            filtered_workspace = {k: v for k, v in workspace.items() if k in known_fields}
+            filtered_workspace = {k: workspace[k] for k in _WORKSPACE_FIELDS.intersection(workspace)}
             workspaces.append(Workspace(**filtered_workspace))
         return workspaces
     
     async def get_workspace(self, workspace_id: int) -> Dict[str, Any]:
         """Get a specific workspace by ID."""
-        data = await self._request("GET", f"/workspaces/{workspace_id}")
+        data = await self._request("GET", f"/workspaces/{workspace_id}", conditional=True)
         return data
     
     async def get_current_time_entry(self) -> Optional[TimeEntry]:
@@ -115,15 +157,7 @@ class TogglAPI:
         if not data:
             return None
         
-        entry_data = parse_time_entry_response(data)
-        # Filter out unknown fields to avoid __init__ errors
-        known_fields = {
-            'id', 'description', 'start', 'duration', 'project_id', 'project_name',
-            'task_id', 'workspace_id', 'billable', 'tags', 'stop', 'created_with',
-            'duronly', 'at', 'uid', 'wid', 'pid', 'tid'
-        }
-        filtered_entry = {k: v for k, v in entry_data.items() if k in known_fields}
-        return TimeEntry(**filtered_entry)
+        return _build_time_entry(data)
     
     async def stop_current_time_entry(self) -> Optional[TimeEntry]:
         """Stop the currently running time entry."""
@@ -159,26 +193,10 @@ class TogglAPI:
         
         data = await self._request("POST", f"/workspaces/{workspace_id}/time_entries", json=payload)
         
-        entry_data = parse_time_entry_response(data)
-        # Filter out unknown fields to avoid __init__ errors
-        known_fields = {
-            'id', 'description', 'start', 'duration', 'project_id', 'project_name',
-            'task_id', 'workspace_id', 'billable', 'tags', 'stop', 'created_with',
-            'duronly', 'at', 'uid', 'wid', 'pid', 'tid'
-        }
-        filtered_entry = {k: v for k, v in entry_data.items() if k in known_fields}
-        return TimeEntry(**filtered_entry)
+        return _build_time_entry(data)
     
     async def stop_time_entry(self, workspace_id: int, time_entry_id: int) -> TimeEntry:
         """Stop a running time entry."""
         data = await self._request("PATCH", f"/workspaces/{workspace_id}/time_entries/{time_entry_id}/stop")
         
-        entry_data = parse_time_entry_response(data)
-        # Filter out unknown fields to avoid __init__ errors
-        known_fields = {
-            'id', 'description', 'start', 'duration', 'project_id', 'project_name',
-            'task_id', 'workspace_id', 'billable', 'tags', 'stop', 'created_with',
-            'duronly', 'at', 'uid', 'wid', 'pid', 'tid'
-        }
-        filtered_entry = {k: v for k, v in entry_data.items() if k in known_fields}
-        return TimeEntry(**filtered_entry)
+        return _build_time_entry(data)
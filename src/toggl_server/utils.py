@@ -2,9 +2,44 @@
 Utility functions for Toggl API operations.
 """
 
+import asyncio
+import functools
+import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Hashable
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # ciso8601 is an optional speedup for large detailed reports
+    _parse_datetime = datetime.fromisoformat
+
+if orjson is not None:
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string (orjson itself returns bytes)"""
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# Timestamp fields in API responses. Both ciso8601 and fromisoformat (Python 3.11+,
+# which pyproject requires) accept the trailing "Z", so no string rewriting is needed
+_DATETIME_FIELDS = ("start", "stop", "at")
+
+_ENTRY_DEFAULTS = (
+    ("billable", False),
+    ("created_with", "Lazy Toggl MCP Server"),
+    ("duronly", False),
+)
+
+# API field name -> model field name, copied only when the API value is set
+_OPTIONAL_ID_FIELDS = (("pid", "project_id"), ("tid", "task_id"), ("uid", "user_id"))
 
 def parse_time_entry_response(entry_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -17,30 +52,24 @@ def parse_time_entry_response(entry_data: Dict[str, Any]) -> Dict[str, Any]:
         Normalized time entry data compatible with TimeEntry model
     """
     # Parse datetime strings
-    if "start" in entry_data:
-        entry_data["start"] = datetime.fromisoformat(entry_data["start"].replace("Z", "+00:00"))
-    if "stop" in entry_data and entry_data["stop"]:
-        entry_data["stop"] = datetime.fromisoformat(entry_data["stop"].replace("Z", "+00:00"))
-    if "at" in entry_data and entry_data["at"]:
-        entry_data["at"] = datetime.fromisoformat(entry_data["at"].replace("Z", "+00:00"))
+    for field in _DATETIME_FIELDS:
+        value = entry_data.get(field)
+        if value:
+            entry_data[field] = _parse_datetime(value)
     
     # Handle missing fields and None values
     if entry_data.get("tags") is None:
         entry_data["tags"] = []
-    entry_data.setdefault("tags", [])
-    entry_data.setdefault("billable", False)
-    entry_data.setdefault("created_with", "Lazy Toggl MCP Server")
-    entry_data.setdefault("duronly", False)
+    for field, default in _ENTRY_DEFAULTS:
+        entry_data.setdefault(field, default)
     
     # Map API field names to our model (but keep both for compatibility)
     if "wid" in entry_data:
         entry_data["workspace_id"] = entry_data["wid"]
-    if "pid" in entry_data and entry_data["pid"]:
-        entry_data["project_id"] = entry_data["pid"]
-    if "tid" in entry_data and entry_data["tid"]:
-        entry_data["task_id"] = entry_data["tid"]
-    if "uid" in entry_data and entry_data["uid"]:
-        entry_data["user_id"] = entry_data["uid"]
+    for api_field, model_field in _OPTIONAL_ID_FIELDS:
+        value = entry_data.get(api_field)
+        if value:
+            entry_data[model_field] = value
     
     return entry_data
 
@@ -55,15 +84,47 @@ def format_duration(duration_seconds: int) -> str:
     Returns:
         Formatted duration string (e.g., "2h 30m", "45m", "< 1m")
     """
-    hours = duration_seconds // 3600
-    minutes = (duration_seconds % 3600) // 60
+    hours, remainder = divmod(duration_seconds, 3600)
+    minutes = remainder // 60
     
-    duration_str = ""
     if hours > 0:
-        duration_str += f"{hours}h "
+        return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
     if minutes > 0:
-        duration_str += f"{minutes}m"
-    if not duration_str:
-        duration_str = "< 1m"
+        return f"{minutes}m"
+    return "< 1m"
+
+
+class SingleFlight:
+    """Shares one in-flight fetch between concurrent callers asking for the same key"""
+    
+    def __init__(self):
+        self._pending: Dict[Hashable, asyncio.Task] = {}  # key -> fetch in progress
+    
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fetch(), or join the identical fetch already running for key
+        
+        The fetch runs as its own task that every caller awaits through asyncio.shield,
+        so a cancelled caller stops waiting without aborting the fetch for the others.
+        
+        Args:
+            key: Identifies the request, e.g. its URL and parameters
+            fetch: Coroutine function that performs the request
+            
+        Returns:
+            The result of the one shared fetch() call
+        """
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._pending[key] = task
+            task.add_done_callback(functools.partial(self._finished, key))
+        return await asyncio.shield(task)
     
-    return duration_str.strip()
+    def _finished(self, key: Hashable, task: asyncio.Task):
+        """Forget a completed fetch so the next caller starts a fresh one"""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # Retrieve the error so a fetch whose callers all left isn't logged as unhandled
+            task.exception()
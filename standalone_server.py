@@ -9,9 +9,6 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-# Set up environment
-os.environ.setdefault('TOGGL_API_TOKEN', '8d2d6c77d4863189fd550c22992ded5c')
-
 try:
     from toggl_server.main import main
     import asyncio
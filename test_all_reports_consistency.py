@@ -4,23 +4,52 @@ Test all three main reports for consistency and cross-matching
 """
 import asyncio
 import os
-import sys
 import re
-from datetime import datetime, timedelta
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from datetime import date, timedelta
+
+from report_cache import cached_report
+from script_output import buffered_stdout
+
+from connector import (
+    admin_server,
+    _get_organization_dashboard_local,
+    _get_team_productivity_report_local,
+    _get_project_profitability_analysis_with_processor
+)
+
+# Metric -> (label, value format), shared by every metric printout below
+METRIC_FORMATS = {
+    "revenue": ("Revenue", "${:.2f}"),
+    "hours": ("Hours", "{:.2f}h"),
+    "profit": ("Profit", "${:.2f}"),
+}
+
+# One alternation so each report is scanned once; the named group says which metric matched
+RE_METRICS = re.compile(
+    r'Total (?:Revenue: USD (?P<revenue>[\d,]+\.?\d*)'
+    r'|Hours: (?P<hours>[\d,]+\.?\d*)h'
+    r'|Profit: USD (?P<profit>[\d,]+\.?\d*))'
+)
+
+def extract_metrics(text):
+    """Return the first revenue, hours and profit figures in a report, 0.0 for any that are missing"""
+    metrics = {}
+    for match in RE_METRICS.finditer(text):
+        name = match.lastgroup
+        if name not in metrics:
+            metrics[name] = float(match.group(name).replace(',', ''))
+    return {name: metrics.get(name, 0.0) for name in METRIC_FORMATS}
+
+def print_report_metrics(report_name, metrics):
+    """Print the metrics extracted from one report"""
+    print(f"   📊 {report_name} Metrics:")
+    for name, (label, value_format) in METRIC_FORMATS.items():
+        print(f"      {label}: {value_format.format(metrics[name])}")
 
 async def test_all_reports_consistency():
     """Test that all reports are consistent with each other"""
     
     try:
-        # Import all report functions
-        from connector import (
-            _get_organization_dashboard_local,
-            _get_team_productivity_report_local, 
-            _get_project_profitability_analysis_with_processor,
-            admin_server
-        )
-        
         api_token = os.getenv("TOGGL_API_TOKEN")
         if not api_token:
             print("❌ TOGGL_API_TOKEN not set")
@@ -33,44 +62,58 @@ async def test_all_reports_consistency():
         
         # Test parameters - past week
         workspace_id = 2047911
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        today = date.today()
+        end_date = today.isoformat()
+        start_date = (today - timedelta(days=7)).isoformat()
         
         print(f"\n🧪 TESTING ALL REPORTS CONSISTENCY")
         print(f"📅 Date range: {start_date} to {end_date}")
         print(f"🏢 Workspace: {workspace_id}")
         print("=" * 80)
         
-        # Test 1: Get Organization Dashboard
-        print("\n📊 TEST 1: Organization Dashboard")
-        print("   Fetching organization dashboard data...")
-        
-        try:
-            org_dashboard = await _get_organization_dashboard_local(
+        # The three reports are independent, so fetch them concurrently. Failures come
+        # back as exceptions and are re-raised inside each test's own error handling
+        print("\n⏳ Fetching organization dashboard, team productivity and project profitability data...")
+        org_dashboard, team_report, project_report = await asyncio.gather(
+            cached_report(_get_organization_dashboard_local,
                 admin_server_instance=admin_server,
                 workspace_id=workspace_id,
                 start_date=start_date,
                 end_date=end_date
-            )
+            ),
+            cached_report(_get_team_productivity_report_local,
+                admin_server_instance=admin_server,
+                workspace_id=workspace_id,
+                start_date=start_date,
+                end_date=end_date,
+                include_individual_metrics=True
+            ),
+            cached_report(_get_project_profitability_analysis_with_processor,
+                admin_server_instance=admin_server,
+                workspace_id=workspace_id,
+                start_date=start_date,
+                end_date=end_date,
+                sort_by="revenue",
+                min_hours=0.0
+            ),
+            return_exceptions=True
+        )
+        
+        # Test 1: Get Organization Dashboard
+        print("\n📊 TEST 1: Organization Dashboard")
+        
+        try:
+            if isinstance(org_dashboard, Exception):
+                raise org_dashboard
             
             if org_dashboard:
                 print("   ✅ Organization dashboard returned data")
                 
                 # Extract key metrics from organization dashboard
-                org_revenue_match = re.search(r'Total Revenue: USD ([\d,]+\.?\d*)', org_dashboard)
-                org_revenue = float(org_revenue_match.group(1).replace(',', '')) if org_revenue_match else 0
-                
-                org_hours_match = re.search(r'Total Hours: ([\d,]+\.?\d*)h', org_dashboard)
-                org_hours = float(org_hours_match.group(1).replace(',', '')) if org_hours_match else 0
+                metrics = extract_metrics(org_dashboard)
+                org_revenue, org_hours, org_profit = metrics["revenue"], metrics["hours"], metrics["profit"]
                 
-                # Look for profit in organization dashboard
-                org_profit_match = re.search(r'Total Profit: USD ([\d,]+\.?\d*)', org_dashboard)
-                org_profit = float(org_profit_match.group(1).replace(',', '')) if org_profit_match else 0
-                
-                print(f"   📊 Organization Dashboard Metrics:")
-                print(f"      Revenue: ${org_revenue:.2f}")
-                print(f"      Hours: {org_hours:.2f}h")
-                print(f"      Profit: ${org_profit:.2f}")
+                print_report_metrics("Organization Dashboard", metrics)
                 
             else:
                 print("   ❌ Organization dashboard failed")
@@ -82,36 +125,19 @@ async def test_all_reports_consistency():
         
         # Test 2: Get Team Productivity Report
         print("\n📊 TEST 2: Team Productivity Report")
-        print("   Fetching team productivity report data...")
         
         try:
-            team_report = await _get_team_productivity_report_local(
-                admin_server_instance=admin_server,
-                workspace_id=workspace_id,
-                start_date=start_date,
-                end_date=end_date,
-                include_individual_metrics=True
-            )
+            if isinstance(team_report, Exception):
+                raise team_report
             
             if team_report:
                 print("   ✅ Team productivity report returned data")
                 
                 # Extract key metrics from team report
-                team_revenue_match = re.search(r'Total Revenue: USD ([\d,]+\.?\d*)', team_report)
-                team_revenue = float(team_revenue_match.group(1).replace(',', '')) if team_revenue_match else 0
-                
-                # Team report shows individual hours, not total hours - extract from summary
-                team_hours_match = re.search(r'Total Hours: ([\d,]+\.?\d*)h', team_report)
-                team_hours = float(team_hours_match.group(1).replace(',', '')) if team_hours_match else 0
+                metrics = extract_metrics(team_report)
+                team_revenue, team_hours, team_profit = metrics["revenue"], metrics["hours"], metrics["profit"]
                 
-                # Look for profit in team report
-                team_profit_match = re.search(r'Total Profit: USD ([\d,]+\.?\d*)', team_report)
-                team_profit = float(team_profit_match.group(1).replace(',', '')) if team_profit_match else 0
-                
-                print(f"   📊 Team Productivity Report Metrics:")
-                print(f"      Revenue: ${team_revenue:.2f}")
-                print(f"      Hours: {team_hours:.2f}h")
-                print(f"      Profit: ${team_profit:.2f}")
+                print_report_metrics("Team Productivity Report", metrics)
                 
             else:
                 print("   ❌ Team productivity report failed")
@@ -123,35 +149,19 @@ async def test_all_reports_consistency():
         
         # Test 3: Get Project Profitability Analysis (we already tested this)
         print("\n📊 TEST 3: Project Profitability Analysis")
-        print("   Fetching project profitability analysis data...")
         
         try:
-            project_report = await _get_project_profitability_analysis_with_processor(
-                admin_server_instance=admin_server,
-                workspace_id=workspace_id,
-                start_date=start_date,
-                end_date=end_date,
-                sort_by="revenue",
-                min_hours=0.0
-            )
+            if isinstance(project_report, Exception):
+                raise project_report
             
             if project_report:
                 print("   ✅ Project profitability analysis returned data")
                 
                 # Extract key metrics from project report
-                proj_revenue_match = re.search(r'Total Revenue: USD ([\d,]+\.?\d*)', project_report)
-                proj_revenue = float(proj_revenue_match.group(1).replace(',', '')) if proj_revenue_match else 0
-                
-                proj_hours_match = re.search(r'Total Hours: ([\d,]+\.?\d*)h', project_report)
-                proj_hours = float(proj_hours_match.group(1).replace(',', '')) if proj_hours_match else 0
-                
-                proj_profit_match = re.search(r'Total Profit: USD ([\d,]+\.?\d*)', project_report)
-                proj_profit = float(proj_profit_match.group(1).replace(',', '')) if proj_profit_match else 0
+                metrics = extract_metrics(project_report)
+                proj_revenue, proj_hours, proj_profit = metrics["revenue"], metrics["hours"], metrics["profit"]
                 
-                print(f"   📊 Project Profitability Analysis Metrics:")
-                print(f"      Revenue: ${proj_revenue:.2f}")
-                print(f"      Hours: {proj_hours:.2f}h")
-                print(f"      Profit: ${proj_profit:.2f}")
+                print_report_metrics("Project Profitability Analysis", metrics)
                 
             else:
                 print("   ❌ Project profitability analysis failed")
@@ -165,62 +175,35 @@ async def test_all_reports_consistency():
         print(f"\n🔍 CROSS-REPORT VALIDATION:")
         print("=" * 80)
         
-        # Revenue consistency
-        print(f"📊 REVENUE COMPARISON:")
-        print(f"   Organization Dashboard: ${org_revenue:.2f}")
-        print(f"   Team Productivity Report: ${team_revenue:.2f}")
-        print(f"   Project Profitability Analysis: ${proj_revenue:.2f}")
-        
-        revenue_values = [v for v in [org_revenue, team_revenue, proj_revenue] if v > 0]
-        if revenue_values:
-            max_revenue = max(revenue_values)
-            min_revenue = min(revenue_values)
-            revenue_diff = max_revenue - min_revenue
-            
-            if revenue_diff < 0.01:
-                print(f"   ✅ Revenue consistency: All reports match perfectly")
-            elif revenue_diff < max_revenue * 0.02:  # Within 2%
-                print(f"   ✅ Revenue consistency: Minor differences (${revenue_diff:.2f}, <2%)")
-            else:
-                print(f"   ⚠️  Revenue inconsistency: Difference of ${revenue_diff:.2f} ({revenue_diff/max_revenue*100:.1f}%)")
-        
-        # Hours consistency
-        print(f"\n📊 HOURS COMPARISON:")
-        print(f"   Organization Dashboard: {org_hours:.2f}h")
-        print(f"   Team Productivity Report: {team_hours:.2f}h")
-        print(f"   Project Profitability Analysis: {proj_hours:.2f}h")
-        
-        hours_values = [v for v in [org_hours, team_hours, proj_hours] if v > 0]
-        if hours_values:
-            max_hours = max(hours_values)
-            min_hours = min(hours_values)
-            hours_diff = max_hours - min_hours
+        # Metric -> (values per report, difference below which the reports match)
+        report_names = ("Organization Dashboard", "Team Productivity Report", "Project Profitability Analysis")
+        comparisons = {
+            "revenue": ((org_revenue, team_revenue, proj_revenue), 0.01),
+            "hours": ((org_hours, team_hours, proj_hours), 0.1),
+            "profit": ((org_profit, team_profit, proj_profit), 0.01),
+        }
+        positive_values = {}
+        for index, (name, (values, match_tolerance)) in enumerate(comparisons.items()):
+            metric, value_format = METRIC_FORMATS[name]
+            print(("\n" if index else "") + f"📊 {metric.upper()} COMPARISON:")
+            for report_name, value in zip(report_names, values):
+                print(f"   {report_name}: {value_format.format(value)}")
             
-            if hours_diff < 0.1:
-                print(f"   ✅ Hours consistency: All reports match perfectly")
-            elif hours_diff < max_hours * 0.02:  # Within 2%
-                print(f"   ✅ Hours consistency: Minor differences ({hours_diff:.2f}h, <2%)")
-            else:
-                print(f"   ⚠️  Hours inconsistency: Difference of {hours_diff:.2f}h ({hours_diff/max_hours*100:.1f}%)")
-        
-        # Profit consistency
-        print(f"\n📊 PROFIT COMPARISON:")
-        print(f"   Organization Dashboard: ${org_profit:.2f}")
-        print(f"   Team Productivity Report: ${team_profit:.2f}")
-        print(f"   Project Profitability Analysis: ${proj_profit:.2f}")
+            positive = positive_values[name] = [v for v in values if v > 0]
+            if positive:
+                max_value = max(positive)
+                diff = max_value - min(positive)
+                
+                if diff < match_tolerance:
+                    print(f"   ✅ {metric} consistency: All reports match perfectly")
+                elif diff < max_value * 0.02:  # Within 2%
+                    print(f"   ✅ {metric} consistency: Minor differences ({value_format.format(diff)}, <2%)")
+                else:
+                    print(f"   ⚠️  {metric} inconsistency: Difference of {value_format.format(diff)} ({diff/max_value*100:.1f}%)")
         
-        profit_values = [v for v in [org_profit, team_profit, proj_profit] if v > 0]
-        if profit_values:
-            max_profit = max(profit_values)
-            min_profit = min(profit_values)
-            profit_diff = max_profit - min_profit
-            
-            if profit_diff < 0.01:
-                print(f"   ✅ Profit consistency: All reports match perfectly")
-            elif profit_diff < max_profit * 0.02:  # Within 2%
-                print(f"   ✅ Profit consistency: Minor differences (${profit_diff:.2f}, <2%)")
-            else:
-                print(f"   ⚠️  Profit inconsistency: Difference of ${profit_diff:.2f} ({profit_diff/max_profit*100:.1f}%)")
+        revenue_values = positive_values["revenue"]
+        hours_values = positive_values["hours"]
+        profit_values = positive_values["profit"]
         
         # Overall Assessment
         print(f"\n🎯 OVERALL ASSESSMENT:")
@@ -297,4 +280,5 @@ async def test_all_reports_consistency():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test_all_reports_consistency())
+    with buffered_stdout():
+        asyncio.run(test_all_reports_consistency())
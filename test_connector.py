@@ -8,12 +8,9 @@ This script tests the basic functionality of the connector to ensure it's workin
 import asyncio
 import os
 import sys
-from pathlib import Path
-
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from connector import server, admin_server, handle_list_tools, handle_call_tool
+from script_output import buffered_stdout
 
 async def test_connector():
     """Test the connector functionality"""
@@ -63,5 +60,6 @@ async def test_connector():
     return True
 
 if __name__ == "__main__":
-    success = asyncio.run(test_connector())
+    with buffered_stdout():
+        success = asyncio.run(test_connector())
     sys.exit(0 if success else 1)
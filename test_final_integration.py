@@ -4,10 +4,19 @@ Final comprehensive test to verify all functions are using Reports API v3
 """
 import asyncio
 import os
-import sys
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from connector import admin_server
+from report_cache import cached_report
+from script_output import buffered_stdout
+
+from connector import (
+    admin_server,
+    _get_organization_dashboard_local,
+    _get_productivity_insights_local,
+    _get_financial_summary_local,
+    _get_project_profitability_analysis_local,
+    _get_team_productivity_report_local,
+    _get_client_profitability_analysis_local
+)
 
 async def test_final_integration():
     """Test all functions to ensure they're using Reports API v3"""
@@ -32,47 +41,30 @@ async def test_final_integration():
         await admin_server.initialize_apis(api_token)
         print("✅ APIs initialized successfully")
         
-        # Test 1: Organization Dashboard
-        print("\n🏢 TEST 1: ORGANIZATION DASHBOARD")
-        print("-" * 40)
-        from connector import _get_organization_dashboard_local
-        dashboard_result = await _get_organization_dashboard_local(admin_server, workspace_id, start_date, end_date)
-        print(dashboard_result[:500] + "..." if len(dashboard_result) > 500 else dashboard_result)
-        
-        # Test 2: Productivity Insights
-        print("\n📊 TEST 2: PRODUCTIVITY INSIGHTS")
-        print("-" * 40)
-        from connector import _get_productivity_insights_local
-        insights_result = await _get_productivity_insights_local(admin_server, workspace_id, start_date, end_date, True)
-        print(insights_result[:500] + "..." if len(insights_result) > 500 else insights_result)
-        
-        # Test 3: Financial Summary
-        print("\n💰 TEST 3: FINANCIAL SUMMARY")
-        print("-" * 40)
-        from connector import _get_financial_summary_local
-        financial_result = await _get_financial_summary_local(admin_server, workspace_id, start_date, end_date, False)
-        print(financial_result[:500] + "..." if len(financial_result) > 500 else financial_result)
-        
-        # Test 4: Project Profitability
-        print("\n📈 TEST 4: PROJECT PROFITABILITY")
-        print("-" * 40)
-        from connector import _get_project_profitability_analysis_local
-        project_result = await _get_project_profitability_analysis_local(admin_server, workspace_id, start_date, end_date, "profit", 0)
-        print(project_result[:500] + "..." if len(project_result) > 500 else project_result)
-        
-        # Test 5: Team Productivity
-        print("\n👥 TEST 5: TEAM PRODUCTIVITY")
-        print("-" * 40)
-        from connector import _get_team_productivity_report_local
-        team_result = await _get_team_productivity_report_local(admin_server, workspace_id, start_date, end_date, True)
-        print(team_result[:500] + "..." if len(team_result) > 500 else team_result)
+        # The six reports are independent, so fetch them concurrently and print in order
+        print("\n⏳ FETCHING ALL REPORTS...")
+        tests = [
+            ("🏢 TEST 1: ORGANIZATION DASHBOARD",
+             cached_report(_get_organization_dashboard_local, admin_server, workspace_id, start_date, end_date)),
+            ("📊 TEST 2: PRODUCTIVITY INSIGHTS",
+             cached_report(_get_productivity_insights_local, admin_server, workspace_id, start_date, end_date, True)),
+            ("💰 TEST 3: FINANCIAL SUMMARY",
+             cached_report(_get_financial_summary_local, admin_server, workspace_id, start_date, end_date, False)),
+            ("📈 TEST 4: PROJECT PROFITABILITY",
+             cached_report(_get_project_profitability_analysis_local, admin_server, workspace_id, start_date, end_date, "profit", 0)),
+            ("👥 TEST 5: TEAM PRODUCTIVITY",
+             cached_report(_get_team_productivity_report_local, admin_server, workspace_id, start_date, end_date, True)),
+            ("💼 TEST 6: CLIENT PROFITABILITY",
+             cached_report(_get_client_profitability_analysis_local, admin_server, workspace_id, start_date, end_date, 0)),
+        ]
+        results = await asyncio.gather(*(report for _, report in tests), return_exceptions=True)
         
-        # Test 6: Client Profitability
-        print("\n💼 TEST 6: CLIENT PROFITABILITY")
-        print("-" * 40)
-        from connector import _get_client_profitability_analysis_local
-        client_result = await _get_client_profitability_analysis_local(admin_server, workspace_id, start_date, end_date, 0)
-        print(client_result[:500] + "..." if len(client_result) > 500 else client_result)
+        for (header, _), result in zip(tests, results):
+            print(f"\n{header}")
+            print("-" * 40)
+            if isinstance(result, Exception):
+                raise result
+            print(result[:500] + "..." if len(result) > 500 else result)
         
         print("\n🎉 ALL TESTS COMPLETED SUCCESSFULLY!")
         print("\n✅ INTEGRATION SUMMARY:")
@@ -89,4 +81,5 @@ async def test_final_integration():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test_final_integration())
+    with buffered_stdout():
+        asyncio.run(test_final_integration())
@@ -4,10 +4,19 @@ Final test to verify revenue fix is working correctly
 """
 import asyncio
 import os
-import sys
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import re
 
-from connector import admin_server
+from report_cache import cached_report
+from script_output import buffered_stdout
+
+RE_REVENUE = re.compile(r'Total Revenue: USD ([\d,]+\.\d+)')
+
+from connector import (
+    admin_server,
+    _get_organization_dashboard_local,
+    _get_productivity_insights_local,
+    _get_financial_summary_local
+)
 
 async def test_revenue_fix():
     """Test that revenue is now correct across all functions"""
@@ -33,15 +42,19 @@ async def test_revenue_fix():
         await admin_server.initialize_apis(api_token)
         print("✅ APIs initialized successfully")
         
+        # The three reports are independent, so fetch them concurrently
+        dashboard_result, insights_result, financial_result = await asyncio.gather(
+            cached_report(_get_organization_dashboard_local, admin_server, workspace_id, start_date, end_date),
+            cached_report(_get_productivity_insights_local, admin_server, workspace_id, start_date, end_date, True),
+            cached_report(_get_financial_summary_local, admin_server, workspace_id, start_date, end_date, False)
+        )
+        
         # Test 1: Organization Dashboard
         print("\n🏢 TEST 1: ORGANIZATION DASHBOARD")
         print("-" * 40)
-        from connector import _get_organization_dashboard_local
-        dashboard_result = await _get_organization_dashboard_local(admin_server, workspace_id, start_date, end_date)
         
         # Extract revenue from dashboard
-        import re
-        revenue_match = re.search(r'Total Revenue: USD ([\d,]+\.\d+)', dashboard_result)
+        revenue_match = RE_REVENUE.search(dashboard_result)
         if revenue_match:
             revenue = float(revenue_match.group(1).replace(',', ''))
             print(f"   Revenue: ${revenue:,.2f}")
@@ -55,11 +68,9 @@ async def test_revenue_fix():
         # Test 2: Productivity Insights
         print("\n📊 TEST 2: PRODUCTIVITY INSIGHTS")
         print("-" * 40)
-        from connector import _get_productivity_insights_local
-        insights_result = await _get_productivity_insights_local(admin_server, workspace_id, start_date, end_date, True)
         
         # Extract revenue from insights
-        revenue_match = re.search(r'Total Revenue: USD ([\d,]+\.\d+)', insights_result)
+        revenue_match = RE_REVENUE.search(insights_result)
         if revenue_match:
             revenue = float(revenue_match.group(1).replace(',', ''))
             print(f"   Revenue: ${revenue:,.2f}")
@@ -73,11 +84,9 @@ async def test_revenue_fix():
         # Test 3: Financial Summary
         print("\n💰 TEST 3: FINANCIAL SUMMARY")
         print("-" * 40)
-        from connector import _get_financial_summary_local
-        financial_result = await _get_financial_summary_local(admin_server, workspace_id, start_date, end_date, False)
         
         # Extract revenue from financial summary
-        revenue_match = re.search(r'Total Revenue: USD ([\d,]+\.\d+)', financial_result)
+        revenue_match = RE_REVENUE.search(financial_result)
         if revenue_match:
             revenue = float(revenue_match.group(1).replace(',', ''))
             print(f"   Revenue: ${revenue:,.2f}")
@@ -101,4 +110,5 @@ async def test_revenue_fix():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test_revenue_fix())
+    with buffered_stdout():
+        asyncio.run(test_revenue_fix())
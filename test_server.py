@@ -4,26 +4,35 @@ Test script to verify the Toggl MCP server setup.
 """
 
 import asyncio
+import inspect
 import os
 import sys
 
+from script_output import buffered_stdout
+
+# Import the server modules once; every check below reuses these names. A failure is
+# recorded rather than raised so the import check can report it like the others
+try:
+    from datetime import datetime
+    from src.toggl_server.main import AdminTogglServer, main as server_main
+    from src.toggl_server.toggl_api import TogglAPI, TogglAPIError
+    from src.toggl_server.models import TogglTimeEntry, TogglWorkspace
+    from src.toggl_server.utils import parse_time_entry_response, format_duration
+    IMPORT_ERROR = None
+except Exception as e:
+    IMPORT_ERROR = e
+
 def test_imports():
     """Test that all modules can be imported without errors."""
-    try:
-        from src.toggl_server.main import AdminTogglServer, main
-        from src.toggl_server.toggl_api import TogglAPI, TogglAPIError
-        from src.toggl_server.models import TogglTimeEntry, TogglWorkspace
-        from src.toggl_server.utils import parse_time_entry_response, format_duration
+    if IMPORT_ERROR is None:
         print("✅ All imports successful")
         return True
-    except Exception as e:
-        print(f"❌ Import error: {e}")
-        return False
+    print(f"❌ Import error: {IMPORT_ERROR}")
+    return False
 
 def test_server_creation():
     """Test that the server can be created without errors."""
     try:
-        from src.toggl_server.main import AdminTogglServer
         server = AdminTogglServer()
         print("✅ Server creation successful")
         return True
@@ -34,7 +43,6 @@ def test_server_creation():
 def test_api_creation():
     """Test that the API client can be created without errors."""
     try:
-        from src.toggl_server.toggl_api import TogglAPI
         # This should fail due to missing token, but not due to import issues
         try:
             api = TogglAPI()
@@ -54,9 +62,6 @@ def test_api_creation():
 def test_model_creation():
     """Test that models can be created without errors."""
     try:
-        from src.toggl_server.models import TogglWorkspace, TogglTimeEntry
-        from datetime import datetime
-        
         # Test workspace creation
         workspace = TogglWorkspace(
             id=1,
@@ -82,7 +87,8 @@ def test_model_creation():
 async def test_async_functions():
     """Test that async functions can be defined without errors."""
     try:
-        from src.toggl_server.main import main
+        if not inspect.iscoroutinefunction(server_main):
+            raise TypeError("main is not a coroutine function")
         print("✅ Async main function import successful")
         return True
     except Exception as e:
@@ -135,4 +141,6 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    with buffered_stdout():
+        exit_code = main()
+    sys.exit(exit_code)
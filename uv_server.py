@@ -5,31 +5,40 @@ UV wrapper for Toggl MCP Server
 
 import sys
 import os
-import subprocess
 
-# Set up environment
-os.environ.setdefault('TOGGL_API_TOKEN', '8d2d6c77d4863189fd550c22992ded5c')
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER = os.path.join(PROJECT_DIR, 'server.py')
+# Project environment uv creates on first run, and its interpreter
+VENV_DIR = os.path.join(PROJECT_DIR, '.venv')
+VENV_PY = os.path.join(VENV_DIR, 'bin', 'python')
+# Full path to uv, resolved once; set UV to use a different install
+UV_PATH = os.environ.get('UV') or os.path.expanduser('~/.local/bin/uv')
 
 def main():
-    """Run the server using uv"""
+    """Run the server using the project virtualenv, or uv when it does not exist yet"""
+    # Already on the venv's interpreter (e.g. launched via .venv/bin/python): run the server
+    # in this process. Compare sys.prefix, as the venv python is a symlink to the base one
+    if os.path.realpath(sys.prefix) == os.path.realpath(VENV_DIR):
+        import runpy
+        runpy.run_path(SERVER, run_name='__main__')
+        return
+    
     try:
-        # Use the full path to uv
-        uv_path = os.path.expanduser('~/.local/bin/uv')
-        if not os.path.exists(uv_path):
-            print(f"Error: uv not found at {uv_path}", file=sys.stderr)
-            print("Please install uv: curl -LsSf https://astral.sh/uv/install.sh | sh", file=sys.stderr)
-            sys.exit(1)
-            
-        # Run with uv
-        result = subprocess.run([
-            uv_path, 'run', '--directory', os.path.dirname(__file__),
-            'python', 'server.py'
-        ], capture_output=True, text=True)
+        # Once the venv exists, exec its interpreter directly and skip uv's environment resolution
+        if os.path.exists(VENV_PY):
+            os.execv(VENV_PY, [VENV_PY, SERVER])
         
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}", file=sys.stderr)
-            sys.exit(result.returncode)
+        # Replace this process with uv, so no wrapper process waits on the server
+        # and the server inherits stdin/stdout for MCP directly
+        os.execv(UV_PATH, [
+            UV_PATH, 'run', '--directory', PROJECT_DIR,
+            'python', 'server.py'
+        ])
             
+    except FileNotFoundError:
+        print(f"Error: uv not found at {UV_PATH}", file=sys.stderr)
+        print("Please install uv: curl -LsSf https://astral.sh/uv/install.sh | sh", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)